@@ -1,14 +1,18 @@
+import codecs
+import functools
+import io
 import logging
 import os
+import shutil
 import sys
 import threading
 import time
 from typing import Annotated, Any, Optional, List, Literal, Dict, Union
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import tempfile
-from enum import Enum
+from enum import Enum, IntEnum
 import re
 
 import slicer, ctk, vtk, qt
@@ -25,8 +29,15 @@ from slicer import vtkMRMLScalarVolumeNode
 import DICOMSegmentationPlugin
 
 import hashlib
+import uuid
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:
+    # windows: task output is tailed from a temp file instead of a non-blocking pipe
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 class Debouncer(qt.QObject):
@@ -38,7 +49,7 @@ class Debouncer(qt.QObject):
         self._timer.timeout.connect(callback)
 
     def start(self, interval_ms: int | None = None) -> None:
-        if interval_ms is not None:
+        if interval_ms is not None and interval_ms != self._timer.interval:
             self._timer.setInterval(interval_ms)
         self._timer.start()
 
@@ -91,6 +102,44 @@ class AsyncFetchPoller(qt.QObject):
         self._thread = None
         self._on_done()
 
+
+class ProgressCoalescer:
+    """Progress callback that writes whole-second status text only when the second changes."""
+
+    __slots__ = ("_last_sec", "_fmt", "_set_text", "_on_output")
+
+    def __init__(
+        self,
+        fmt: str,
+        set_text: Callable[[str], None],
+        on_output: Callable[[str | None], None] | None = None,
+    ) -> None:
+        self._last_sec = -1
+        self._fmt = fmt
+        self._set_text = set_text
+        self._on_output = on_output
+
+    def __call__(self, progress: float, stdout: str | None) -> None:
+        sec = int(progress)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._set_text(self._fmt % sec)
+        if self._on_output is not None:
+            self._on_output(stdout)
+
+
+class PaletteChangeWatcher(qt.QObject):
+    _PALETTE_EVENTS = (qt.QEvent.PaletteChange, qt.QEvent.ApplicationPaletteChange)
+
+    def __init__(self, callback: Callable[[], None], parent: qt.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._callback = callback
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() in self._PALETTE_EVENTS:
+            self._callback()
+        return False
+
 #
 # MHubRunner
 #
@@ -246,13 +295,47 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self._parameterNode = None
         self._parameterNodeGuiTag = None
         self._modelSearchDebouncer = None
+        self._settingsSummaryDebouncer = None
+        self._checkCanApplyDebouncer = None
         self._pendingModelSearchText = ""
+        self._renderedModelSearch: tuple[str, list] | None = None
         self._modelFetchPoller = None
         self._modelStatusPoller = None
+        self._backendImagesPoller = None
+        self._backendImages: list[str] = []
+        self._backendImagesRefreshPending = False
+        self._dockerInfoPoller = None
+        self._dockerInfo: DockerInformation | None = None
+        self._hostGpuPoller = None
+        self._hostGpus: list[str] = []
+        self._outputLoadPoller = None
+        self._outputLoadResult: tuple | None = None
+        self._pendingOutputFile: str | None = None
+        self._outputFileLoaders: dict[str, Callable[[str], None]] = {
+            ".json": self._loadJsonOutputFile,
+            ".csv": self._loadCsvOutputFile,
+            ".seg.dcm": self._loadSegmentationOutputFile,
+        }
+        self._pendingLogOutput: list[str] = []
+        self._logFlushTimer = None
         self._settingsDialog = None
         self._settingsWidget = None
+        self._settingsSectionWidgets = []
         self._dockerSetupDismissed = False
         self._syncingDockerPath = False
+        self._qsettings = None
+        self._isDark: bool | None = None
+        self._paletteWatcher = None
+        self._iconPathCache: dict[tuple[str, bool], str | None] = {}
+        self._iconCache: dict[tuple[str, float], qt.QIcon] = {}
+        self._buttonIconState: dict[str, tuple] = {}
+        self._modelRowIndex: dict[int, int] = {}
+        self._modelTableInitialized = False
+        self._lastApplyState: tuple | None = None
+        self._checkedGpuNames: set[str] = set()
+        self._summaryPalette = None
+        self._summaryPaletteKey: tuple[int, float] | None = None
+        self._lastModalityProbe: tuple[int | None, str | None, str | None] = (None, None, None)
 
     def setup(self) -> None:
         """
@@ -260,15 +343,28 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         """
         ScriptedLoadableModuleWidget.setup(self)
 
+        # one shared settings handle, written back in cleanup()
+        self._qsettings = qt.QSettings()
+
         # Load widget from .ui file (created by Qt Designer).
         # Additional widgets can be instantiated manually and added to self.layout.
         uiWidget = slicer.util.loadUI(self.resourcePath('UI/MHubRunner.ui'))
         self.layout.addWidget(uiWidget)
         self.ui = slicer.util.childWidgetVariables(uiWidget)
+
+        # coalesce bursts of signal-driven refreshes into a single update
+        self._settingsSummaryDebouncer = Debouncer(50, self._doUpdateSettingsSummary, parent=uiWidget)
+        self._checkCanApplyDebouncer = Debouncer(50, self._checkCanApply, parent=uiWidget)
+
         self._loadSettingsUi()
         self._setupSettingsSectionCollapse()
 
         self._ensureLoggerConfigured()
+
+        # theme state is cached and only recomputed when the palette changes
+        self._paletteWatcher = PaletteChangeWatcher(self._onPaletteChanged, parent=uiWidget)
+        uiWidget.installEventFilter(self._paletteWatcher)
+
         self._updateDockerSetupLogo()
         self._applySummaryOpacity()
         self._applyMainButtonIcons()
@@ -283,7 +379,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         # Create logic class. Logic implements all computations that should be possible to run
         # in batch mode, without a graphical user interface.
         self.logic = MHubRunnerLogic()
-        settings = qt.QSettings()
+        settings = self._qsettings
 
         # Connections
 
@@ -300,7 +396,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.ui.cmdReloadHostGpus.connect('clicked(bool)', self.updateHostGpuList)
         self.ui.chkGpuEnabled.connect('clicked(bool)', self.onGpuEnabled)
         self.ui.lstHostGpu.connect('itemSelectionChanged()', self.updateSettingsSummary)
-        self.ui.lstHostGpu.connect('itemChanged(QListWidgetItem*)', self.updateSettingsSummary)
+        self.ui.lstHostGpu.connect('itemChanged(QListWidgetItem*)', self._onHostGpuItemChanged)
         self.ui.lstBackendImages.connect('itemSelectionChanged()', self.onBackendImageSelect)
         self.ui.cmdImageUpdate.connect('clicked(bool)', self.onBackendImageUpdate)
         self.ui.cmdImageRemove.connect('clicked(bool)', self.onBackendImageRemove)
@@ -368,11 +464,27 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self._modelSearchDebouncer = Debouncer(200, self._applyModelSearch, parent=uiWidget)
         self._modelFetchPoller = AsyncFetchPoller(10, self._onModelFetchDone, parent=uiWidget)
         self._modelStatusPoller = AsyncFetchPoller(200, self._onModelStatusDone, parent=uiWidget)
+        self._backendImagesPoller = AsyncFetchPoller(100, self._onBackendImagesDone, parent=uiWidget)
+        self._dockerInfoPoller = AsyncFetchPoller(100, self._onDockerInfoDone, parent=uiWidget)
+        self._hostGpuPoller = AsyncFetchPoller(100, self._renderHostGpuList, parent=uiWidget)
+        self._outputLoadPoller = AsyncFetchPoller(50, self._onOutputLoadDone, parent=uiWidget)
+
+        # log output of concurrent tasks is written to the log widget at most every 100 ms
+        self._logFlushTimer = qt.QTimer(uiWidget)
+        self._logFlushTimer.setSingleShot(True)
+        self._logFlushTimer.setInterval(100)
+        self._logFlushTimer.timeout.connect(self._flushLogOutput)
+
+        # keep only the most recent lines, long runs would otherwise grow the document without bound
+        self.ui.txtLogs.setMaximumBlockCount(self._LOG_MAX_BLOCKS)
 
         # search box "searchModel" and model list "lstModelList"
         self.ui.searchModel.textChanged.connect(self.onSearchModel)
         #self.ui.lstModelList.connect('itemSelectionChanged()', self.onModelSelect)
+        self._initModelTable()
         self.ui.tblModelList.connect('cellClicked(int, int)', self.onModelSelectFromTable)
+        self.ui.tblModelList.verticalScrollBar().connect('valueChanged(int)', self._ensureVisibleModelActionWidgets)
+        self.ui.tblModelList.verticalScrollBar().connect('rangeChanged(int, int)', self._ensureVisibleModelActionWidgets)
         self.onSearchModel("")
 
         # input modality (for non-DICOM volumes)
@@ -444,6 +556,8 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         Called when the application closes and the module widget is destroyed.
         """
         self.removeObservers()
+        if self._qsettings is not None:
+            self._qsettings.sync()
 
     def enter(self) -> None:
         """
@@ -460,7 +574,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if self._parameterNode:
             self._parameterNode.disconnectGui(self._parameterNodeGuiTag)
             self._parameterNodeGuiTag = None
-            self.removeObserver(self._parameterNode, vtk.vtkCommand.ModifiedEvent, self._checkCanApply)
+            self.removeObserver(self._parameterNode, vtk.vtkCommand.ModifiedEvent, self._scheduleCheckCanApply)
 
     def onSceneStartClose(self, caller, event) -> None:
         """
@@ -468,6 +582,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         """
         # Parameter node will be reset, do not use it anymore
         self.setParameterNode(None)
+        self._lastModalityProbe = (None, None, None)
 
     def onSceneEndClose(self, caller, event) -> None:
         """
@@ -502,13 +617,13 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
         if self._parameterNode:
             self._parameterNode.disconnectGui(self._parameterNodeGuiTag)
-            self.removeObserver(self._parameterNode, vtk.vtkCommand.ModifiedEvent, self._checkCanApply)
+            self.removeObserver(self._parameterNode, vtk.vtkCommand.ModifiedEvent, self._scheduleCheckCanApply)
         self._parameterNode = inputParameterNode
         if self._parameterNode:
             # Note: in the .ui file, a Qt dynamic property called "SlicerParameterName" is set on each
             # ui element that needs connection.
             self._parameterNodeGuiTag = self._parameterNode.connectGui(self.ui)
-            self.addObserver(self._parameterNode, vtk.vtkCommand.ModifiedEvent, self._checkCanApply)
+            self.addObserver(self._parameterNode, vtk.vtkCommand.ModifiedEvent, self._scheduleCheckCanApply)
             self._checkCanApply()
 
 
@@ -517,12 +632,6 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         # get subject hierarchy node
         shNode = slicer.vtkMRMLSubjectHierarchyNode.GetSubjectHierarchyNode(slicer.mrmlScene)
 
-        logger.debug(
-            "SubjectHierarchyTreeView currentItemChanged: %s %s",
-            itemId,
-            shNode.GetItemName(itemId),
-        )
-
         # get the volume node
         volumeNode = shNode.GetItemDataNode(itemId)
 
@@ -530,7 +639,17 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if volumeNode:
             self.ui.inputSelector.setCurrentNode(volumeNode)
             self._updateInputModalityState(volumeNode)
-            self._checkCanApply()
+            self._scheduleCheckCanApply()
+
+        # everything below is diagnostic output only, skip the VTK round-trips unless debugging
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        logger.debug(
+            "SubjectHierarchyTreeView currentItemChanged: %s %s",
+            itemId,
+            shNode.GetItemName(itemId),
+        )
 
         # --- multi selection:
 
@@ -541,8 +660,10 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.ui.SubjectHierarchyTreeView.currentItems(items)
 
         # print all selected items
-        for i in range(items.GetNumberOfIds()):
-            logger.debug("Selected item: %s", shNode.GetItemName(items.GetId(i)))
+        logger.debug(
+            "Selected items: %s",
+            ", ".join(shNode.GetItemName(items.GetId(i)) for i in range(items.GetNumberOfIds())),
+        )
 
         # --- selection modality
 
@@ -566,7 +687,6 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             except Exception as e:
                 logger.warning("Error accessing node's DICOM data: %s", e)
 
-
     def onUpdateDockerExecutable(self, path) -> None:
         assert self.logic is not None
         # user enters a new path for the docker executable manually
@@ -579,7 +699,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         # set docker executable
         logger.debug("Docker executable updated: %s (from %s)", docker_executable, path)
         self.logic._executables["docker"] = docker_executable
-        settings = qt.QSettings()
+        settings = self._qsettings
         settings.setValue("MHubRunner/DockerExecutable", docker_executable)
         self._syncDockerExecutablePath(docker_executable)
         self._updateDockerSetupScreen()
@@ -594,21 +714,39 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
         # set docker executable
         if docker_executable:
-            settings = qt.QSettings()
+            settings = self._qsettings
             settings.setValue("MHubRunner/DockerExecutable", docker_executable)
         self._syncDockerExecutablePath(docker_executable)
         self._updateDockerSetupScreen()
         self.updateSettingsSummary()
 
     def _appendLogOutput(self, stdout: str | None) -> None:
-        if stdout is None:
+        # most progress ticks carry no new output
+        if not stdout:
             return
         # remove ANSI escapes and control chars that can break QTextCursor
         stdout = re.sub(r'\x1b\[[0-9;]*m', '', stdout)
         stdout = stdout.replace('\r', '\n')
         stdout = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', stdout)
-        if stdout.strip() != "":
-            self.ui.txtLogs.appendPlainText(stdout)
+        if stdout.strip() == "":
+            return
+        self._pendingLogOutput.append(stdout)
+        if self._logFlushTimer is None:
+            self._flushLogOutput()
+        elif not self._logFlushTimer.isActive():
+            self._logFlushTimer.start()
+
+    def _flushLogOutput(self) -> None:
+        if not self._pendingLogOutput:
+            return
+        # one append (one layout pass) for everything collected since the last flush
+        text = "\n".join(self._pendingLogOutput)
+        self._pendingLogOutput.clear()
+        self.ui.txtLogs.appendPlainText(text)
+
+    def _clearLogOutput(self) -> None:
+        self._pendingLogOutput.clear()
+        self.ui.txtLogs.clear()
 
     def _getDockerExecutablePath(self) -> str:
         path = self.ui.pthDockerExecutable.currentPath if hasattr(self.ui, "pthDockerExecutable") else ""
@@ -637,11 +775,13 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         path = self._getDockerExecutablePath()
         if path and os.path.exists(path):
             return True
-        try:
-            import shutil
-            return shutil.which("docker") is not None
-        except Exception:
-            return False
+        return self._whichDocker() is not None
+
+    def _whichDocker(self) -> str | None:
+        # shares the logic's briefly cached PATH lookup (summary refreshes come in bursts)
+        if self.logic is None:
+            return shutil.which("docker")
+        return self.logic.whichDocker()
 
     def showDockerSetupScreen(self, force: bool = False) -> None:
         if self._dockerSetupDismissed and not force:
@@ -666,19 +806,36 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         else:
             self.showDockerSetupScreen()
 
-    def _isDarkTheme(self) -> bool:
+    def _probeDarkTheme(self) -> bool:
         palette = qt.QApplication.palette()
         window_color = palette.color(qt.QPalette.Window)
         return window_color.lightness() < 128
 
+    def _isDarkTheme(self) -> bool:
+        if self._isDark is None:
+            self._isDark = self._probeDarkTheme()
+        return self._isDark
+
+    def _onPaletteChanged(self) -> None:
+        is_dark = self._probeDarkTheme()
+        if is_dark == self._isDark:
+            return
+        self._isDark = is_dark
+
+        # icons of the previous theme will not be requested again
+        self._iconCache.clear()
+        self._updateDockerSetupLogo()
+        self._applySummaryOpacity()
+        self._applyMainButtonIcons()
+        self._applyOutputButtonIcons()
+
     def _updateDockerSetupLogo(self) -> None:
         if not hasattr(self.ui, "lblDockerSetupLogo"):
             return
-        icons_path = os.path.join(os.path.dirname(__file__), 'Resources', 'Icons')
         logo_name = "MRunner_w.png" if self._isDarkTheme() else "MRunner_b.png"
-        logo_path = os.path.join(icons_path, logo_name)
-        if not os.path.exists(logo_path):
+        if logo_name not in self._iconIndex():
             return
+        logo_path = os.path.join(self._ICONS_DIR, logo_name)
         pixmap = qt.QPixmap(logo_path)
         self.ui.lblDockerSetupLogo.setPixmap(pixmap)
 
@@ -700,54 +857,109 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def _applyOutputButtonIcons(self) -> None:
         if not hasattr(self.ui, "cmdOpenOutputFile"):
             return
-        icon_size = qt.QSize(14, 14)
-        self.ui.cmdOpenOutputFile.setIcon(self._themeIcon("hi_show"))
-        self.ui.cmdOpenOutputFile.setIconSize(icon_size)
+        self._setButtonIcon(self.ui.cmdOpenOutputFile, "hi_show")
         self._setButtonTextWithIcon(self.ui.cmdOpenOutputFile, self.ui.cmdOpenOutputFile.text)
         self._updateOpenOutputFileButton()
 
     def _updateMainButtonIcons(self) -> None:
         icon_size = getattr(self, "_mainButtonIconSize", qt.QSize(14, 14))
-        running = bool(ProgressObserver.getTasksWhere(operation="run"))
+        running = ProgressObserver.running_count > 0
         if running:
             apply_icon = "hi_running"
             apply_opacity = 1.0
         else:
             apply_opacity = self._ICON_DISABLED_OPACITY if not self.ui.applyButton.enabled else 1.0
             apply_icon = "hi_noplay" if not self.ui.applyButton.enabled else "hi_play"
-        self.ui.applyButton.setIcon(self._themeIcon(apply_icon, apply_opacity))
-        self.ui.applyButton.setIconSize(icon_size)
+        self._setButtonIcon(self.ui.applyButton, apply_icon, apply_opacity, icon_size)
 
         cancel_opacity = self._ICON_DISABLED_OPACITY if not self.ui.cancelButton.enabled else 1.0
-        self.ui.cancelButton.setIcon(self._themeIcon("hi_cancel", cancel_opacity))
-        self.ui.cancelButton.setIconSize(icon_size)
+        self._setButtonIcon(self.ui.cancelButton, "hi_cancel", cancel_opacity, icon_size)
+
+    def _setButtonIcon(self, button, base_name: str, opacity: float = 1.0, icon_size: qt.QSize | None = None) -> None:
+        # selection changes and progress ticks re-request the same icon, only touch the button on a change
+        icon_size = icon_size or qt.QSize(14, 14)
+        state = (base_name, round(opacity, 2), self._isDarkTheme(), icon_size.width(), icon_size.height())
+        key = button.objectName
+        if self._buttonIconState.get(key) == state:
+            return
+        self._buttonIconState[key] = state
+        button.setIcon(self._themeIcon(base_name, opacity))
+        button.setIconSize(icon_size)
 
     def _themeIcon(self, base_name: str, opacity: float = 1.0) -> qt.QIcon:
-        icons_path = os.path.join(os.path.dirname(__file__), 'Resources', 'Icons')
-        if self._isDarkTheme():
-            candidates = (f"{base_name}_w.png", f"{base_name}_b.png")
+        is_dark = self._isDarkTheme()
+        path_key = (base_name, is_dark)
+        if path_key in self._iconPathCache:
+            icon_path = self._iconPathCache[path_key]
         else:
-            candidates = (f"{base_name}_b.png", f"{base_name}_w.png")
-        icon_path = None
-        for candidate in candidates:
-            candidate_path = os.path.join(icons_path, candidate)
-            if os.path.exists(candidate_path):
-                icon_path = candidate_path
-                break
+            if is_dark:
+                candidates = (f"{base_name}_w.png", f"{base_name}_b.png")
+            else:
+                candidates = (f"{base_name}_b.png", f"{base_name}_w.png")
+            icon_index = self._iconIndex()
+            icon_path = None
+            for candidate in candidates:
+                if candidate in icon_index:
+                    icon_path = os.path.join(self._ICONS_DIR, candidate)
+                    break
+            self._iconPathCache[path_key] = icon_path
         if not icon_path:
             return qt.QIcon()
-        pixmap = qt.QPixmap(icon_path)
+
+        # icons are keyed by their resolved path, so a theme switch never hits a stale entry
+        icon_key = (icon_path, round(opacity, 2))
+        icon = self._iconCache.get(icon_key)
+        if icon is not None:
+            return icon
         if opacity >= 1.0:
-            return qt.QIcon(pixmap)
-        faded = qt.QPixmap(pixmap.size())
+            icon = qt.QIcon(qt.QPixmap(icon_path))
+        else:
+            icon = qt.QIcon(self._fadedPixmap(icon_path, opacity))
+        self._iconCache[icon_key] = icon
+        return icon
+
+    def _fadedPixmap(self, icon_path: str, opacity: float) -> qt.QPixmap:
+        # fade on a raster QImage and upload once; PythonQt does not expose QImage.bits()
+        # as a writable buffer, so the alpha multiply is left to the raster paint engine
+        source = qt.QImage(icon_path).convertToFormat(qt.QImage.Format_ARGB32_Premultiplied)
+        faded = qt.QImage(source.size(), qt.QImage.Format_ARGB32_Premultiplied)
         faded.fill(qt.Qt.transparent)
         painter = qt.QPainter(faded)
         painter.setOpacity(opacity)
-        painter.drawPixmap(0, 0, pixmap)
+        painter.drawImage(0, 0, source)
         painter.end()
-        return qt.QIcon(faded)
+        return qt.QPixmap.fromImage(faded)
 
+    @classmethod
+    def _iconIndex(cls) -> frozenset[str]:
+        # the icon set is fixed at install time, scan it once (a module reload redefines the class)
+        if cls._iconIndexCache is None:
+            try:
+                with os.scandir(cls._ICONS_DIR) as entries:
+                    cls._iconIndexCache = frozenset(entry.name for entry in entries if entry.is_file())
+            except OSError:
+                logger.warning("Icons directory not readable: %s", cls._ICONS_DIR)
+                cls._iconIndexCache = frozenset()
+        return cls._iconIndexCache
+
+    _ICONS_DIR = os.path.join(os.path.dirname(__file__), 'Resources', 'Icons')
+    _iconIndexCache: frozenset[str] | None = None
     _ICON_DISABLED_OPACITY = 0.2
+    _MODEL_TABLE_BUTTON_SIZE = 24
+    _MODEL_TABLE_LOADING_WIDTH = 72
+    _MODEL_TABLE_ROW_OVERSCAN = 5
+    _LOG_MAX_BLOCKS = 5000
+
+    # pull button (enabled, icon, dimmed, text, tooltip), indexed by ModelStatus
+    _PULL_BUTTON_STATES = (
+        (False, "hi_pull", True, "loading...", "Checking image status"),    # UNKNOWN
+        (True, "hi_pull", False, "", "Pull image from MHub.ai"),            # PULLABLE
+        (False, "hi_pull", True, "loading...", "Image is being pulled"),    # PULLING
+        (False, "hi_pulled", True, "", "Image is available locally"),       # PULLED
+        (False, "hi_pull", True, "loading...", "Image is currently running"),  # RUNNING
+    )
+    _OUTPUT_FILE_EXTENSIONS = (".json", ".csv", ".seg.dcm")
+    _TABULAR_OUTPUT_EXTENSIONS = (".json", ".csv")
     _ICON_TEXT_PREFIX = " "
     _SETTINGS_SECTION_WIDGET_NAMES = (
         "ctkCollapsibleButton",
@@ -761,6 +973,9 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         ("Import only (DICOMSEG)", "import_only"),
         ("Do nothing", "none"),
     )
+    _OUTPUT_HANDLING_VALID = frozenset(value for _, value in _OUTPUT_HANDLING_OPTIONS)
+    _TRUE_STRINGS = frozenset(("1", "true", "yes", "on"))
+    _FALSE_STRINGS = frozenset(("0", "false", "no", "off"))
 
     def _withIconLabel(self, text: str) -> str:
         if not text:
@@ -770,19 +985,30 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         return f"{self._ICON_TEXT_PREFIX}{text}"
 
     def _setButtonTextWithIcon(self, button, text: str) -> None:
-        button.text = self._withIconLabel(text)
+        text = self._withIconLabel(text)
+        # progress handlers call this every tick, skip the relayout when nothing changed
+        if button.text != text:
+            button.text = text
 
     def showDockerSetupScreenFromSettings(self, checked: bool = False) -> None:
         self.showDockerSetupScreen(force=True)
 
+    def _onHostGpuItemChanged(self, item) -> None:
+        if item.checkState() == qt.Qt.Checked:
+            self._checkedGpuNames.add(item.text())
+        else:
+            self._checkedGpuNames.discard(item.text())
+        self.updateSettingsSummary()
+
     def updateSettingsSummary(self) -> None:
-        gpu_count = self.ui.lstHostGpu.count
+        if self._settingsSummaryDebouncer is None:
+            self._doUpdateSettingsSummary()
+            return
+        self._settingsSummaryDebouncer.start()
+
+    def _doUpdateSettingsSummary(self) -> None:
         gpu_enabled = self.ui.chkGpuEnabled.checked
-        selected_gpus = []
-        for i in range(gpu_count):
-            item = self.ui.lstHostGpu.item(i)
-            if item.checkState() == qt.Qt.Checked:
-                selected_gpus.append(item.text())
+        selected_gpus = sorted(self._checkedGpuNames)
         if not selected_gpus:
             selected_gpus = [item.text() for item in self.ui.lstHostGpu.selectedItems()]
 
@@ -800,11 +1026,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if docker_exec and os.path.exists(docker_exec):
             docker_status = f"Docker available at {docker_exec}"
         else:
-            try:
-                import shutil
-                docker_path = shutil.which("docker")
-            except Exception:
-                docker_path = None
+            docker_path = self._whichDocker()
             if docker_path:
                 docker_status = f"Docker available at {docker_path}"
             elif docker_exec:
@@ -841,10 +1063,20 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def _applySummaryOpacity(self, opacity: float = 0.6) -> None:
         if not hasattr(self.ui, "lblSetupSummary"):
             return
-        palette = self.ui.lblSetupSummary.palette
+        # the faded palette only depends on the application palette (its cache key changes with
+        # every modification) and the opacity; it is built once per combination and reused
+        base = qt.QApplication.palette(self.ui.lblSetupSummary)
+        key = (base.cacheKey(), opacity)
+        if key == self._summaryPaletteKey and self._summaryPalette is not None:
+            if self.ui.lblSetupSummary.palette != self._summaryPalette:
+                self.ui.lblSetupSummary.setPalette(self._summaryPalette)
+            return
+        palette = qt.QPalette(base)
         color = palette.color(qt.QPalette.WindowText)
         color.setAlpha(int(255 * opacity))
         palette.setColor(qt.QPalette.WindowText, color)
+        self._summaryPalette = palette
+        self._summaryPaletteKey = key
         self.ui.lblSetupSummary.setPalette(palette)
 
     def _loadSettingsUi(self) -> None:
@@ -865,10 +1097,12 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if getattr(self, "_settingsSectionSignalsWired", False):
             return
         self._settingsSectionSignalsWired = True
-        for name in self._SETTINGS_SECTION_WIDGET_NAMES:
-            widget = getattr(self.ui, name, None)
-            if widget is None:
-                continue
+        self._settingsSectionWidgets = [
+            widget
+            for widget in (getattr(self.ui, name, None) for name in self._SETTINGS_SECTION_WIDGET_NAMES)
+            if widget is not None
+        ]
+        for widget in self._settingsSectionWidgets:
             widget.connect(
                 "toggled(bool)",
                 lambda _, w=widget: self._closeOtherSettingsSections(w),
@@ -877,11 +1111,9 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def _closeOtherSettingsSections(self, opened_widget) -> None:
         if opened_widget is None or opened_widget.collapsed:
             return
-        for name in self._SETTINGS_SECTION_WIDGET_NAMES:
-            widget = getattr(self.ui, name, None)
-            if widget is None or widget is opened_widget:
-                continue
-            widget.collapsed = True
+        for widget in self._settingsSectionWidgets:
+            if widget is not opened_widget:
+                widget.collapsed = True
 
     def openSettingsDialog(self) -> None:
         self._loadSettingsUi()
@@ -939,7 +1171,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         level_name = str(level_text).upper()
         level = getattr(logging, level_name, logging.INFO)
         logger.setLevel(level)
-        settings = qt.QSettings()
+        settings = self._qsettings
         settings.setValue("MHubRunner/LogLevel", level_name)
         self.updateSettingsSummary()
 
@@ -951,9 +1183,9 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if isinstance(value, (int, float)):
             return bool(value)
         text = str(value).strip().lower()
-        if text in ("1", "true", "yes", "on"):
+        if text in self._TRUE_STRINGS:
             return True
-        if text in ("0", "false", "no", "off"):
+        if text in self._FALSE_STRINGS:
             return False
         return default
 
@@ -961,19 +1193,19 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if not hasattr(self.ui, "cmbOutputHandling"):
             return
         value = self.ui.cmbOutputHandling.itemData(index)
-        settings = qt.QSettings()
+        settings = self._qsettings
         settings.setValue("MHubRunner/OutputHandling", value or "load_import")
 
     def onShowCompletionNotificationChanged(self, checked: bool) -> None:
-        settings = qt.QSettings()
+        settings = self._qsettings
         settings.setValue("MHubRunner/ShowCompletionNotification", bool(checked))
 
     def onOpenOutputPanelOnCompleteChanged(self, checked: bool) -> None:
-        settings = qt.QSettings()
+        settings = self._qsettings
         settings.setValue("MHubRunner/OpenOutputPanelOnComplete", bool(checked))
 
     def onOpenRunFolderOnCompleteChanged(self, checked: bool) -> None:
-        settings = qt.QSettings()
+        settings = self._qsettings
         settings.setValue("MHubRunner/OpenRunFolderOnComplete", bool(checked))
 
     def _getOutputHandlingMode(self) -> str:
@@ -982,44 +1214,62 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             index = self.ui.cmbOutputHandling.currentIndex
             value = self.ui.cmbOutputHandling.itemData(index)
         if value is None:
-            settings = qt.QSettings()
+            settings = self._qsettings
             value = settings.value("MHubRunner/OutputHandling", "load_import")
         value = str(value)
-        if value not in {"load_import", "load_only", "import_only", "none"}:
+        if value not in self._OUTPUT_HANDLING_VALID:
             return "load_import"
         return value
 
     def _getShowCompletionNotification(self) -> bool:
         if hasattr(self.ui, "chkShowCompletionNotification"):
             return bool(self.ui.chkShowCompletionNotification.checked)
-        settings = qt.QSettings()
+        settings = self._qsettings
         return self._coerceBool(settings.value("MHubRunner/ShowCompletionNotification", True), default=True)
 
     def _getOpenOutputPanelOnComplete(self) -> bool:
         if hasattr(self.ui, "chkOpenOutputPanelOnComplete"):
             return bool(self.ui.chkOpenOutputPanelOnComplete.checked)
-        settings = qt.QSettings()
+        settings = self._qsettings
         return self._coerceBool(settings.value("MHubRunner/OpenOutputPanelOnComplete", True), default=True)
 
     def _getOpenRunFolderOnComplete(self) -> bool:
         if hasattr(self.ui, "chkOpenRunFolderOnComplete"):
             return bool(self.ui.chkOpenRunFolderOnComplete.checked)
-        settings = qt.QSettings()
+        settings = self._qsettings
         return self._coerceBool(settings.value("MHubRunner/OpenRunFolderOnComplete", False), default=False)
 
+    def _scheduleCheckCanApply(self, caller=None, event=None) -> None:
+        if self._checkCanApplyDebouncer is None:
+            self._checkCanApply()
+            return
+        self._checkCanApplyDebouncer.start()
+
     def _checkCanApply(self, caller=None, event=None) -> None:
 
+        # skip the refresh if none of the inputs to the button state changed since the last call
+        running = ProgressObserver.running_count > 0
+        model = self.getModelFromTableSelection()
+        inputVolume = self._parameterNode.inputVolume if self._parameterNode else None
+        # keyed on stable identifiers and the shown fields, not object ids (a catalog re-fetch
+        # creates new Model objects, which may reuse the ids of the freed ones)
+        state = (
+            running,
+            (model.id, model.label, model.license_model, model.license_weights) if model else None,
+            inputVolume.GetID() if inputVolume else None,
+            bool(model and model.inputs_compatibility),
+        )
+        if state == self._lastApplyState:
+            return
+        self._lastApplyState = state
+
         # check if model is already running
-        tasks = ProgressObserver.getTasksWhere(operation="run")
-        if len(tasks) > 0:
+        if running:
             self.ui.cancelButton.enabled = True
             self._updateMainButtonIcons()
             return
         self.ui.cancelButton.enabled = False
 
-        # check if model is selected
-        model = self.getModelFromTableSelection()
-
         # check if docker is available
         # TODO: ...
 
@@ -1061,13 +1311,20 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         instanceUIDs = node.GetAttribute('DICOM.instanceUIDs')
         if instanceUIDs:
             self.ui.cmbInputModality.enabled = False
-            modality = None
-            try:
-                inst_uids = instanceUIDs.split()
-                if inst_uids:
-                    modality = slicer.dicomDatabase.instanceValue(inst_uids[0], '0008,0060')
-            except Exception:
+
+            # re-entrant node change signals would otherwise query the DICOM database every time
+            last_node_id, last_uids, last_modality = self._lastModalityProbe
+            if last_node_id == id(node) and last_uids == instanceUIDs:
+                modality = last_modality
+            else:
                 modality = None
+                try:
+                    inst_uids = instanceUIDs.split()
+                    if inst_uids:
+                        modality = slicer.dicomDatabase.instanceValue(inst_uids[0], '0008,0060')
+                except Exception:
+                    modality = None
+                self._lastModalityProbe = (id(node), instanceUIDs, modality)
             if modality and modality in [self.ui.cmbInputModality.itemText(i) for i in range(self.ui.cmbInputModality.count)]:
                 self.ui.cmbInputModality.setCurrentText(modality)
             return
@@ -1080,7 +1337,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
         # values
         num_tasks = len(ProgressObserver._tasks)
-        details = "\n".join(["- " + " ".join(task.cmd) + "\n>" + str(task.data) + "\n" for task in ProgressObserver._tasks])
+        details = "\n".join(["- " + " ".join(task.cmd) + "\n>" + str(task.data) + "\n" for task in ProgressObserver._tasks.values()])
 
         # display message box
         msg = qt.QMessageBox()
@@ -1101,9 +1358,30 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def updateHostGpuList(self) -> None:
         assert self.logic is not None
 
-        gpus = self.logic.getGPUInformation()
-        for gpu in gpus:
-            self.ui.lstHostGpu.addItem(gpu)
+        # fetch synchronously until the poller exists (setup)
+        if self._hostGpuPoller is None:
+            self._hostGpus = self.logic.getGPUInformation()
+            self._renderHostGpuList()
+            return
+
+        # nvidia-smi can take seconds to answer (or time out), query it in the background
+        def worker():
+            assert self.logic is not None
+            self._hostGpus = self.logic.getGPUInformation()
+
+        self._hostGpuPoller.start(worker)
+
+    def _renderHostGpuList(self) -> None:
+        gpus = self._hostGpus
+
+        # add all gpus in one go; the summary is refreshed once below instead of per item signal
+        self.ui.lstHostGpu.setUpdatesEnabled(False)
+        wasBlocked = self.ui.lstHostGpu.blockSignals(True)
+        try:
+            self.ui.lstHostGpu.addItems(list(gpus))
+        finally:
+            self.ui.lstHostGpu.blockSignals(wasBlocked)
+            self.ui.lstHostGpu.setUpdatesEnabled(True)
         self.ui.chkGpuEnabled.checked = len(gpus) > 0
         self.ui.chkGpuEnabled.enabled = len(gpus) > 0
         self.updateSettingsSummary()
@@ -1115,7 +1393,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.ui.lstHostGpu.enabled = enabled
 
         # enable/disable apply button
-        self._checkCanApply()
+        self._scheduleCheckCanApply()
         self.updateSettingsSummary()
 
     def loadModelRepo(self) -> None:
@@ -1133,6 +1411,11 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         text = self._pendingModelSearchText or ""
         if hasattr(self.logic, "_model_cache"):
             models = self.logic.getModels(cached=True, hydrate_status=False)
+
+            # typing and reverting within the debounce window leaves the table as it is
+            rendered = self._renderedModelSearch
+            if rendered is not None and rendered[0] == text and rendered[1] is models:
+                return
             self._renderFilteredModels(models, text)
             return
         self._fetchModelsAsync()
@@ -1140,6 +1423,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def _renderFilteredModels(self, models: list['Model'], text: str) -> None:
         filtered = [model for model in models if model.str_match(text)]
         self.renderModelTable(filtered)
+        self._renderedModelSearch = (text, models)
 
     def _fetchModelsAsync(self) -> None:
         if self._modelFetchPoller is None or self._modelFetchPoller.is_running():
@@ -1176,6 +1460,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self._startModelStatusHydration()
 
     def _setModelTableStatus(self, message: str) -> None:
+        self._renderedModelSearch = None
         self.ui.tblModelList.clear()
         self.ui.tblModelList.setRowCount(1)
         self.ui.tblModelList.setColumnCount(1)
@@ -1183,6 +1468,8 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         item = qt.QTableWidgetItem(message)
         item.setFlags(item.flags() & ~qt.Qt.ItemIsEditable)
         self.ui.tblModelList.setItem(0, 0, item)
+        self._modelRowIndex = {}
+        self._modelTableInitialized = False
 
     def _startModelStatusHydration(self) -> None:
         if self._modelStatusPoller is None or self._modelStatusPoller.is_running():
@@ -1190,9 +1477,10 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         if not hasattr(self.logic, "_model_cache"):
             return
 
+        # only the pull buttons depend on the status, update them in place instead of re-rendering
         for model in self.logic._model_cache:
             model.status = ModelStatus.UNKNOWN
-        self._renderFilteredModels(self.logic._model_cache, self._pendingModelSearchText or "")
+        self._updatePullButtons(self.logic._model_cache)
 
         def worker():
             assert self.logic is not None
@@ -1203,30 +1491,46 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def _onModelStatusDone(self) -> None:
         models = self.logic.getModels(cached=True, hydrate_status=False) if hasattr(self.logic, "_model_cache") else []
         if models:
-            self._renderFilteredModels(models, self._pendingModelSearchText or "")
-
-    def renderModelTable(self, models: list['Model']) -> None:
+            self._updatePullButtons(models)
+
+    def _applyPullButtonState(self, btnPull, model: 'Model') -> None:
+        enabled, icon_name, dimmed, text, tooltip = self._PULL_BUTTON_STATES[model.status]
+        btnPull.enabled = enabled
+        btnPull.setIcon(self._themeIcon(icon_name, self._ICON_DISABLED_OPACITY if dimmed else 1.0))
+        btnPull.setText(text)
+        btnPull.setMinimumWidth(self._MODEL_TABLE_LOADING_WIDTH if text else self._MODEL_TABLE_BUTTON_SIZE)
+        btnPull.toolTip = tooltip
+
+    def _updatePullButtonForRow(self, row: int, model: 'Model') -> None:
+        widget = self.ui.tblModelList.cellWidget(row, 4)
+        btnPull = widget.findChild(qt.QPushButton, "btnPull") if widget else None
+        if btnPull is None:
+            return
+        self._applyPullButtonState(btnPull, model)
 
-        # set table height to 10 rows
-        self.ui.tblModelList.setRowCount(10)
-        self.ui.tblModelList.clear()
+    def _updatePullButtons(self, models: list['Model']) -> None:
+        for model in models:
+            row = self._modelRowIndex.get(id(model))
+            if row is not None:
+                self._updatePullButtonForRow(row, model)
 
-        # remove all rows from model table
-        self.ui.tblModelList.setRowCount(0)
+    def _initModelTable(self) -> None:
+        table = self.ui.tblModelList
+        table.clear()
 
         # add models to table with columns
-        self.ui.tblModelList.setColumnCount(5)
-        self.ui.tblModelList.setHorizontalHeaderLabels(["Model", "Type", "Image", "CU", "Actions"])
+        table.setColumnCount(5)
+        table.setHorizontalHeaderLabels(["Model", "Type", "Image", "CU", "Actions"])
 
         # make table rows slim
-        self.ui.tblModelList.verticalHeader().setDefaultSectionSize(24)
+        table.verticalHeader().setDefaultSectionSize(24)
 
         # size columns to content, only model label stretches
-        header = self.ui.tblModelList.horizontalHeader()
+        header = table.horizontalHeader()
         header.setStretchLastSection(False)
 
         # select full row when cell is clicked
-        self.ui.tblModelList.setSelectionBehavior(qt.QAbstractItemView.SelectRows)
+        table.setSelectionBehavior(qt.QAbstractItemView.SelectRows)
 
         # make first column (model label) stretchable
         # NOTE: makes label column un-editable - not the best UX?!
@@ -1236,125 +1540,127 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         header.setSectionResizeMode(3, qt.QHeaderView.ResizeToContents)
         header.setSectionResizeMode(4, qt.QHeaderView.ResizeToContents)
 
-        # fill table with models that match the search text
-        for model in models:
-            rowPosition = self.ui.tblModelList.rowCount
-            self.ui.tblModelList.insertRow(rowPosition)
-
-            # add model name
-            label_item = qt.QTableWidgetItem(model.label)
-            label_item.setData(qt.Qt.UserRole, model)
-            self.ui.tblModelList.setItem(rowPosition, 0, label_item)
-
-            # add model type (placeholder)
-            self.ui.tblModelList.setItem(rowPosition, 1, qt.QTableWidgetItem(",".join(model.categories)))
-
-            # add model image (placeholder)
-            self.ui.tblModelList.setItem(rowPosition, 2, qt.QTableWidgetItem(",".join(model.modalities)))
-
-            # add commercial use column
-            cu_item = qt.QTableWidgetItem("Yes" if model.commercial_use else "No")
-            cu_item.setFlags(cu_item.flags() & ~qt.Qt.ItemIsEditable)
-            cu_item.setTextAlignment(qt.Qt.AlignCenter)
-            cu_item.setToolTip(
-                "Commercial use likely allowed; check license"
-                if model.commercial_use
-                else "Commercial use likely not allowed; check license"
-            )
-            self.ui.tblModelList.setItem(rowPosition, 3, cu_item)
-
-            # create horizontal layout, add pull, run, and details buttons, and set layout to cell
-            layout = qt.QHBoxLayout()
-            layout.setSpacing(0)
-            layout.setContentsMargins(0,0,0,0)
-
-            # Create function that creates a new scope for each button
-            def create_pull_handler(btnPull, model):
-                return lambda: self.onModelPull(btnPull, model)
-
-            def create_details_handler(model):
-                return lambda: self.onModelDetails(model)
-
-            def create_web_handler(model):
-                return lambda: self.onModelWeb(model)
-
-            icon_size = qt.QSize(14, 14)
-            button_size = 24
-            loading_width = 72
-
-            btnPull = qt.QPushButton()
-            btnPull.setIcon(self._themeIcon("hi_pull"))
-            btnPull.setIconSize(icon_size)
-            btnPull.setFixedHeight(button_size)
-            btnPull.setMinimumWidth(button_size)
-            btnPull.clicked.connect(create_pull_handler(btnPull, model))
-            layout.addWidget(btnPull)
-
-            if model.status == ModelStatus.UNKNOWN:
-                btnPull.enabled = False
-                btnPull.setIcon(self._themeIcon("hi_pull", self._ICON_DISABLED_OPACITY))
-                btnPull.setText("loading...")
-                btnPull.setMinimumWidth(loading_width)
-                btnPull.toolTip = "Checking image status"
-
-            elif model.status == ModelStatus.PULLING:
-                btnPull.enabled = False
-                btnPull.setIcon(self._themeIcon("hi_pull", self._ICON_DISABLED_OPACITY))
-                btnPull.setText("loading...")
-                btnPull.setMinimumWidth(loading_width)
-                btnPull.toolTip = "Image is being pulled"
-
-            elif model.status == ModelStatus.PULLED:
-                btnPull.enabled = False
-                btnPull.setIcon(self._themeIcon("hi_pulled", self._ICON_DISABLED_OPACITY))
-                btnPull.setText("")
-                btnPull.setMinimumWidth(button_size)
-                btnPull.toolTip = "Image is available locally"
-
-            elif model.status == ModelStatus.RUNNING:
-                btnPull.enabled = False
-                btnPull.setIcon(self._themeIcon("hi_pull", self._ICON_DISABLED_OPACITY))
-                btnPull.setText("loading...")
-                btnPull.setMinimumWidth(loading_width)
-                btnPull.toolTip = "Image is currently running"
+        self._modelTableInitialized = True
 
-            else:
-                btnPull.enabled = True
-                btnPull.toolTip = "Pull image from MHub.ai"
-                btnPull.setText("")
-                btnPull.setMinimumWidth(button_size)
-
-            btnDetails = qt.QPushButton()
-            btnDetails.setIcon(self._themeIcon("hi_info"))
-            btnDetails.setIconSize(icon_size)
-            btnDetails.setFixedSize(button_size, button_size)
-            btnDetails.toolTip = "Show model details"
-            btnDetails.clicked.connect(create_details_handler(model))
-            layout.addWidget(btnDetails)
-
-            btnWeb = qt.QPushButton()
-            btnWeb.setIcon(self._themeIcon("hi_modelcard"))
-            btnWeb.setIconSize(icon_size)
-            btnWeb.setFixedSize(button_size, button_size)
-            btnWeb.toolTip = "Open model card in browser"
-            btnWeb.clicked.connect(create_web_handler(model))
-            layout.addWidget(btnWeb)
-
-            widget = qt.QWidget()
-            widget.setLayout(layout)
-            self.ui.tblModelList.setCellWidget(rowPosition, 4, widget)
-
-            # if model has more than 1 input, disable row
-            if not model.inputs_compatibility:
-                for ci in range(5):
-                    item = self.ui.tblModelList.item(rowPosition, ci)
-                    if item:
-                        item.setFlags(item.flags() & ~qt.Qt.ItemIsEditable)  # Make it non-editable
-                        item.setBackground(qt.Qt.gray)  # Change background color to indicate it's disabled
-                        item.setForeground(qt.Qt.white)  # Change text color to white
+    def renderModelTable(self, models: list['Model']) -> None:
+        table = self.ui.tblModelList
+
+        # (re-)create the table skeleton only if it is not set up for model rows
+        if not self._modelTableInitialized:
+            self._initModelTable()
+
+        # build all rows with updates and sorting suspended, then lay out once
+        sorting_enabled = table.sortingEnabled
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        self._modelRowIndex = {}
+        try:
+            # remove all rows from model table
+            table.setRowCount(0)
+            table.setRowCount(len(models))
+
+            # fill table with models that match the search text
+            for rowPosition, model in enumerate(models):
+
+                # add model name
+                label_item = qt.QTableWidgetItem(model.label)
+                label_item.setData(qt.Qt.UserRole, model)
+                table.setItem(rowPosition, 0, label_item)
+                self._modelRowIndex[id(model)] = rowPosition
+
+                # add model type (placeholder)
+                table.setItem(rowPosition, 1, qt.QTableWidgetItem(",".join(model.categories)))
+
+                # add model image (placeholder)
+                table.setItem(rowPosition, 2, qt.QTableWidgetItem(",".join(model.modalities)))
+
+                # add commercial use column
+                cu_item = qt.QTableWidgetItem("Yes" if model.commercial_use else "No")
+                cu_item.setFlags(cu_item.flags() & ~qt.Qt.ItemIsEditable)
+                cu_item.setTextAlignment(qt.Qt.AlignCenter)
+                cu_item.setToolTip(
+                    "Commercial use likely allowed; check license"
+                    if model.commercial_use
+                    else "Commercial use likely not allowed; check license"
+                )
+                table.setItem(rowPosition, 3, cu_item)
+
+                # if model has more than 1 input, disable row
+                if not model.inputs_compatibility:
+                    for ci in range(5):
+                        item = table.item(rowPosition, ci)
+                        if item:
+                            item.setFlags(item.flags() & ~qt.Qt.ItemIsEditable)  # Make it non-editable
+                            item.setBackground(qt.Qt.gray)  # Change background color to indicate it's disabled
+                            item.setForeground(qt.Qt.white)  # Change text color to white
+        finally:
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+
+        # action buttons are only created for rows that scroll into view
+        self._ensureVisibleModelActionWidgets()
 
         self.updateLicenseSummary()
 
+    def _ensureVisibleModelActionWidgets(self, *args) -> None:
+        table = self.ui.tblModelList
+        row_count = table.rowCount
+        if row_count == 0 or table.columnCount < 5 or not self._modelRowIndex:
+            return
+        first_row = table.rowAt(0)
+        if first_row < 0:
+            first_row = 0
+        last_row = table.rowAt(table.viewport().height - 1)
+        if last_row < 0:
+            last_row = row_count - 1
+        last_row = min(row_count - 1, last_row + self._MODEL_TABLE_ROW_OVERSCAN)
+
+        for row in range(first_row, last_row + 1):
+            if table.cellWidget(row, 4) is not None:
+                continue
+            model = self.getModelFromTableSelection(row)
+            if model is not None:
+                table.setCellWidget(row, 4, self._createModelActionsWidget(model))
+
+    def _createModelActionsWidget(self, model: 'Model') -> qt.QWidget:
+        icon_size = qt.QSize(14, 14)
+        button_size = self._MODEL_TABLE_BUTTON_SIZE
+
+        # create horizontal layout, add pull, run, and details buttons, and set layout to cell
+        layout = qt.QHBoxLayout()
+        layout.setSpacing(0)
+        layout.setContentsMargins(0,0,0,0)
+
+        btnPull = qt.QPushButton()
+        btnPull.setObjectName("btnPull")
+        btnPull.setIconSize(icon_size)
+        btnPull.setFixedHeight(button_size)
+        btnPull.setMinimumWidth(button_size)
+        btnPull.clicked.connect(lambda: self.onModelPull(btnPull, model))
+        layout.addWidget(btnPull)
+
+        self._applyPullButtonState(btnPull, model)
+
+        btnDetails = qt.QPushButton()
+        btnDetails.setIcon(self._themeIcon("hi_info"))
+        btnDetails.setIconSize(icon_size)
+        btnDetails.setFixedSize(button_size, button_size)
+        btnDetails.toolTip = "Show model details"
+        btnDetails.clicked.connect(lambda: self.onModelDetails(model))
+        layout.addWidget(btnDetails)
+
+        btnWeb = qt.QPushButton()
+        btnWeb.setIcon(self._themeIcon("hi_modelcard"))
+        btnWeb.setIconSize(icon_size)
+        btnWeb.setFixedSize(button_size, button_size)
+        btnWeb.toolTip = "Open model card in browser"
+        btnWeb.clicked.connect(lambda: self.onModelWeb(model))
+        layout.addWidget(btnWeb)
+
+        widget = qt.QWidget()
+        widget.setLayout(layout)
+        return widget
+
 
     def onModelDetails(self, model: 'Model') -> None:
 
@@ -1366,24 +1672,25 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             return f"{headline}:\n" +  "\n".join([f"  - {item}" for item in items])
 
         # generate model details string
-        details = [model.label]
-        details += [model.description]
-        details += [hlst("Modalities", model.modalities)]
-        details += [hlst("Categories", model.categories)]
-        details += [hlst("Inputs", model.inputs)]
+        details = [
+            model.label,
+            model.description,
+            hlst("Modalities", model.modalities),
+            hlst("Categories", model.categories),
+            hlst("Inputs", model.inputs),
+        ]
         license_lines = []
         if model.license_model:
             license_lines.append(f"Model: {model.license_model}")
         if model.license_weights:
             license_lines.append(f"Weights: {model.license_weights}")
-        if license_lines:
-            details += [hlst("License", license_lines)]
-        else:
-            details += ["License: N/A"]
-        details += [f"Commercial use allowed: {'Yes' if model.commercial_use else 'No'}"]
-        details += ["\n REQUIRED CITATION: \n"]
-        details += [f"The model was provided through the MHub.ai platform and is available under https://mhub.ai/models/{model.name}."]
-        details += [model.cite]
+        details.append(hlst("License", license_lines) if license_lines else "License: N/A")
+        details.extend((
+            f"Commercial use allowed: {'Yes' if model.commercial_use else 'No'}",
+            "\n REQUIRED CITATION: \n",
+            f"The model was provided through the MHub.ai platform and is available under https://mhub.ai/models/{model.name}.",
+            model.cite,
+        ))
 
         # display popup with model details
         msg = qt.QMessageBox()
@@ -1428,14 +1735,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
             logger.debug("Image %s pulled, args: %s", image_name, args)
 
-        last_progress_sec = {"value": -1}
-
-        def on_progress(progress: float, stdout: str | None):
-            sec = int(progress)
-            if sec != last_progress_sec["value"]:
-                button.text = f"Pulling ({sec}s)"
-                last_progress_sec["value"] = sec
-            self._appendLogOutput(stdout)
+        on_progress = ProgressCoalescer("Pulling (%ds)", lambda text: setattr(button, "text", text), self._appendLogOutput)
 
         # pull model
         self.logic.update_image(image_name, on_stop=on_stop, on_progress=on_progress)
@@ -1475,18 +1775,24 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         logger.debug("Model selected: row=%s col=%s name=%s", row, col, model_name)
 
         # update apply button
-        self._checkCanApply()
+        self._scheduleCheckCanApply()
 
     def onDockerUpdate(self) -> None:
         assert self.logic is not None
 
-        info = self.logic.getDockerInformation()
-        if not info.available:
-            self.ui.lblBackendVersion.setText("Docker not available.")
-        else:
-            self.ui.lblBackendVersion.setText(info.version)
+        # `docker --version` may block for up to its timeout on a misconfigured host
+        if self._dockerInfoPoller is None:
+            self._dockerInfo = self.logic.getDockerInformation()
+            self._onDockerInfoDone()
+        elif not self._dockerInfoPoller.is_running():
+            def worker():
+                assert self.logic is not None
+                self._dockerInfo = self.logic.getDockerInformation()
 
-        self.updateBackendImagesList()
+            self._dockerInfoPoller.start(worker)
+
+        # explicit reload, always ask docker again
+        self.updateBackendImagesList(cached=False)
         search_text = self.ui.searchModel.text
         self._pendingModelSearchText = search_text or ""
         if hasattr(self.logic, "_model_cache"):
@@ -1495,6 +1801,15 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             self.onSearchModel(search_text)
         self.updateSettingsSummary()
 
+    def _onDockerInfoDone(self) -> None:
+        info = self._dockerInfo
+        if info is None:
+            return
+        if not info.available:
+            self.ui.lblBackendVersion.setText("Docker not available.")
+        else:
+            self.ui.lblBackendVersion.setText(info.version)
+
     def onBackendImageSelect(self) -> None:
 
         # if no image selected, disable update and remove buttons
@@ -1563,14 +1878,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
                 return
             self.updateBackendImagesList()
 
-        last_progress_sec = {"value": -1}
-
-        def on_progress(progress: float, stdout: str | None):
-            sec = int(progress)
-            if sec != last_progress_sec["value"]:
-                selected.setText(f"{image_name} (updating... {sec}s)")
-                last_progress_sec["value"] = sec
-            self._appendLogOutput(stdout)
+        on_progress = ProgressCoalescer(f"{image_name} (updating... %ds)", selected.setText, self._appendLogOutput)
 
         # update image
         self.logic.update_image(image_name, on_stop=on_stop, on_progress=on_progress)
@@ -1635,32 +1943,57 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             # remove from list on success
             self.ui.lstBackendImages.takeItem(self.ui.lstBackendImages.row(selected))
 
-        last_progress_sec = {"value": -1}
-
-        def on_progress(progress: float, stdout: str | None):
-            sec = int(progress)
-            if sec != last_progress_sec["value"]:
-                selected.setText(f"{image_name} (removing... {sec}s)")
-                last_progress_sec["value"] = sec
-            self._appendLogOutput(stdout)
+        on_progress = ProgressCoalescer(f"{image_name} (removing... %ds)", selected.setText, self._appendLogOutput)
 
         # remove image
         self.logic.remove_image(image_name, on_stop=on_stop, on_progress=on_progress)
 
-    def updateBackendImagesList(self) -> None:
+    def updateBackendImagesList(self, cached: bool = True) -> None:
         assert self.logic is not None
 
-        # get available docker images
-        images = self.logic.getLocalImages(cached=False)
+        # fetch synchronously until the poller exists (setup)
+        if self._backendImagesPoller is None:
+            self._backendImages = self.logic.getLocalImages(cached=cached)
+            self._renderBackendImagesList()
+            return
 
-        # update list
-        self.ui.lstBackendImages.clear()
-        for image in images:
-            item = qt.QListWidgetItem()
-            item.setText(image)
-            raw_name = image.split(" (", 1)[0] if " (" in image else image
-            item.setData(qt.Qt.UserRole, raw_name)
-            self.ui.lstBackendImages.addItem(item)
+        # `docker images` runs in the background; a refresh requested meanwhile runs once afterwards
+        if self._backendImagesPoller.is_running():
+            self._backendImagesRefreshPending = True
+            return
+
+        def worker():
+            assert self.logic is not None
+            self._backendImages = self.logic.getLocalImages(cached=cached)
+
+        self._backendImagesPoller.start(worker)
+
+    def _onBackendImagesDone(self) -> None:
+        self._renderBackendImagesList()
+        if self._backendImagesRefreshPending:
+            self._backendImagesRefreshPending = False
+            self.updateBackendImagesList(cached=False)
+
+    def _renderBackendImagesList(self) -> None:
+        images = self._backendImages
+
+        # update list in one go; selection signals are suppressed while repopulating
+        self.ui.lstBackendImages.setUpdatesEnabled(False)
+        wasBlocked = self.ui.lstBackendImages.blockSignals(True)
+        try:
+            self.ui.lstBackendImages.clear()
+            for image in images:
+                item = qt.QListWidgetItem(image)
+                raw_name = image.partition(" (")[0]
+                item.setData(qt.Qt.UserRole, raw_name)
+                self.ui.lstBackendImages.addItem(item)
+        finally:
+            self.ui.lstBackendImages.blockSignals(wasBlocked)
+            self.ui.lstBackendImages.setUpdatesEnabled(True)
+
+        # the list was rebuilt, so nothing is selected anymore
+        self.ui.cmdImageUpdate.enabled = False
+        self.ui.cmdImageRemove.enabled = False
 
     # def initiateHostTest(self) -> None:
     #     assert self.logic is not None
@@ -1699,32 +2032,36 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         # capture selected run
         selected_run = self.ui.cmbSelectRunOutput.currentText
 
-        # get run directories, ordered by creation date
-        run_dirs = []
-        for d in os.scandir(runs_dir):
-            if not d.is_dir() or d.name.startswith("."):
-                continue
-            run_dirs.append(d)
-        run_dirs.sort(key=lambda d: d.stat().st_ctime, reverse=True)
-        run_dirs = [str(d.name) for d in run_dirs]
+        # get run directories, ordered by creation date (one stat per entry)
+        entries = [
+            (d.stat().st_ctime, d.name)
+            for d in os.scandir(runs_dir)
+            if d.is_dir() and not d.name.startswith(".")
+        ]
+        entries.sort(key=lambda e: e[0], reverse=True)
+        run_dirs = [name for _, name in entries]
 
-        # run_dirs = [str(d.name) for d in os.scandir(runs_dir) if d.is_dir() and not d.name.startswith(".")]
         logger.debug("run_dirs: %s", run_dirs)
 
-        # clear run list
-        self.ui.cmbSelectRunOutput.clear()
+        # repopulate the list without emitting a selection change per inserted item
+        combo = self.ui.cmbSelectRunOutput
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems(run_dirs)
 
-        # update list
-        for run_dir in run_dirs:
-            self.ui.cmbSelectRunOutput.addItem(str(run_dir))
+            # select previous run
+            if selected_run:
+                combo.setCurrentText(selected_run)
 
-        # select previous run
-        if selected_run:
-            self.ui.cmbSelectRunOutput.setCurrentText(selected_run)
+            # open latest run directory
+            if open_latest and run_dirs:
+                combo.setCurrentText(run_dirs[0])
+        finally:
+            combo.blockSignals(False)
 
-        # open latest run directory
-        if open_latest and run_dirs:
-            self.ui.cmbSelectRunOutput.setCurrentText(run_dirs[0])
+        # refresh the output file list once for the final selection
+        self.prepareOutput()
 
     def prepareOutput(self) -> None:
         assert self.logic is not None
@@ -1738,20 +2075,30 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         output_dir = os.path.join(runs_dir, selected_run)
 
         # get output files
-        output_files = self.logic.scanDirectoryForFilesWithExtension(output_dir, extension=[".json", ".csv", ".seg.dcm"])
-
-        # clear output list
-        self.ui.lstOutputFiles.clear()
+        output_files = self.logic.scanDirectoryForFilesWithExtension(output_dir, extension=self._OUTPUT_FILE_EXTENSIONS)
 
         logger.debug("Output files: %s", output_files)
 
-        # update list
-        for output_file in output_files:
-            item = qt.QListWidgetItem()
-            item.setText(os.path.relpath(output_file, output_dir))
-            self.ui.lstOutputFiles.addItem(item)
+        # scanned paths are joined onto output_dir, so the relative path is a plain prefix strip
+        prefix = os.path.join(output_dir, "")
+        prefix_len = len(prefix)
 
-            item.setData(qt.Qt.UserRole, output_file)
+        # rebuild output list in one go; the open button is refreshed once below
+        self.ui.lstOutputFiles.setUpdatesEnabled(False)
+        wasBlocked = self.ui.lstOutputFiles.blockSignals(True)
+        try:
+            self.ui.lstOutputFiles.clear()
+            for output_file in output_files:
+                if output_file.startswith(prefix):
+                    rel_path = output_file[prefix_len:]
+                else:
+                    rel_path = os.path.relpath(output_file, output_dir)
+                item = qt.QListWidgetItem(rel_path)
+                item.setData(qt.Qt.UserRole, output_file)
+                self.ui.lstOutputFiles.addItem(item)
+        finally:
+            self.ui.lstOutputFiles.blockSignals(wasBlocked)
+            self.ui.lstOutputFiles.setUpdatesEnabled(True)
         self._updateOpenOutputFileButton()
 
     def onOutputFileSelect(self) -> None:
@@ -1767,80 +2114,157 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         assert self.logic is not None
         logger.debug("Opening output file: %s", output_file)
 
-        # create table node
-        if output_file.endswith(".json") or output_file.endswith(".csv"):
-            if not self.ui.outputTableSelector.currentNode():
+        # classify once by suffix (".seg.dcm" spans two) and dispatch
+        root, ext = os.path.splitext(output_file)
+        if ext == ".dcm":
+            ext = os.path.splitext(root)[1] + ext
+        loader = self._outputFileLoaders.get(ext)
+        if loader is not None:
+            loader(output_file)
+
+    def _loadJsonOutputFile(self, output_file: str) -> None:
+        self._loadTabularOutputFile(output_file, "JSON", self._readJsonOutputFile)
+
+    def _loadCsvOutputFile(self, output_file: str) -> None:
+        self._loadTabularOutputFile(output_file, "CSV", self._readCsvOutputFile)
+
+    def _loadSegmentationOutputFile(self, output_file: str) -> None:
+        assert self.logic is not None
+        self.logic.loadSegmentations([output_file])
+
+    def _loadTabularOutputFile(
+        self,
+        output_file: str,
+        kind: str,
+        reader: Callable[[str], tuple[list[str], list]],
+    ) -> None:
+
+        def load():
+            try:
+                header, rows = reader(output_file)
+                self._outputLoadResult = (output_file, kind, header, rows, None)
+            except Exception as exc:
+                self._outputLoadResult = (output_file, kind, None, None, exc)
+
+        # parse synchronously until the poller exists (setup)
+        if self._outputLoadPoller is None:
+            load()
+            self._onOutputLoadDone()
+            return
+
+        # large outputs are parsed in the background; only the latest request made meanwhile is loaded afterwards
+        if self._outputLoadPoller.is_running():
+            self._pendingOutputFile = output_file
+            return
+
+        self._outputLoadPoller.start(load)
+
+    def _onOutputLoadDone(self) -> None:
+        assert self.logic is not None
+        if self._outputLoadResult is None:
+            return
+        output_file, kind, header, rows, exc = self._outputLoadResult
+        self._outputLoadResult = None
+
+        if exc is not None:
+            logger.error("Failed to load %s output file: %s", kind, output_file, exc_info=exc)
+            slicer.util.errorDisplay(f"Failed to load {kind} output file:\n{output_file}\n\n{exc}")
+        else:
+            # create table node
+            tableNode = self.ui.outputTableSelector.currentNode()
+            if not tableNode:
                 logger.debug("Creating table node")
                 tableNode = slicer.vtkMRMLTableNode()
                 slicer.mrmlScene.AddNode(tableNode)
                 self.ui.outputTableSelector.setCurrentNode(tableNode)
-            else:
-                tableNode = self.ui.outputTableSelector.currentNode()
 
-        # if file is json, open text
-        if output_file.endswith(".json"):
-            # self.openFile(output_file)
+            # create table
+            self.logic.renderTableData(tableNode, header, rows)
 
-            import json
+        if self._pendingOutputFile:
+            pending, self._pendingOutputFile = self._pendingOutputFile, None
+            self._loadOutputFile(pending)
 
-            # read json file
-            try:
-                with open(output_file) as f:
-                    data = json.load(f)
-            except (OSError, json.JSONDecodeError) as exc:
-                logger.exception("Failed to load JSON output file: %s", output_file)
-                slicer.util.errorDisplay(f"Failed to load JSON output file:\n{output_file}\n\n{exc}")
-                return
+    def _readJsonOutputFile(self, output_file: str) -> tuple[list[str], list[list]]:
 
-            # flatten nested json into dot-notation keys (array items in square brackets)
-            def flatten_json(y):
-                out = {}
-                def flatten(x, name=''):
-                    if type(x) is dict:
-                        for a in x:
-                            flatten(x[a], name + a + '.')
-                    elif type(x) is list:
-                        i = 0
-                        for a in x:
-                            flatten(a, name + str(i) + '.')
-                            i += 1
-                    else:
-                        out[name[:-1]] = x
-                flatten(y)
-                return out
+        # read json file (model outputs may hold NaN or big integers, parse with json as written)
+        data = _read_json_file(output_file, use_orjson=False)
 
-            # flatten json
-            data = flatten_json(data)
+        # flatten nested json into dot-notation key / value rows (array items by index)
+        def dict_children(x):
+            return reversed(x.items())
 
-            logger.debug("Flattened json: %s", data)
+        def list_children(x):
+            return ((str(i), x[i]) for i in range(len(x) - 1, -1, -1))
 
-            # create table
-            self.logic.renderTableData(tableNode, ["Key", "Value"], [[k, v] for k, v in data.items()])
+        # children are yielded in reverse so popping keeps document order; None marks a leaf
+        children_by_type = {
+            dict: dict_children, list: list_children,
+            str: None, int: None, float: None, bool: None, type(None): None,
+        }
 
-        elif output_file.endswith(".csv"):
+        def flatten_json(y) -> list[list]:
+            rows = []
+            stack = [((), y)]
+            while stack:
+                prefix, x = stack.pop()
+                try:
+                    children = children_by_type[type(x)]
+                except KeyError:
+                    # subclasses, e.g. OrderedDict from an object_pairs_hook
+                    children = dict_children if isinstance(x, dict) else list_children if isinstance(x, list) else None
+                if children is None:
+                    rows.append([".".join(prefix), x])
+                else:
+                    stack.extend((prefix + (k,), v) for k, v in children(x))
+            return rows
 
-            import csv
+        # flatten json
+        rows = flatten_json(data)
+        del data
 
-            # read csv file
-            try:
-                with open(output_file) as f:
-                    reader = csv.reader(f)
-                    csv_header = next(reader)
-                    csv_data = list(reader)
-            except (OSError, csv.Error, StopIteration) as exc:
-                logger.exception("Failed to load CSV output file: %s", output_file)
-                slicer.util.errorDisplay(f"Failed to load CSV output file:\n{output_file}\n\n{exc}")
-                return
+        logger.debug("Flattened json: %s", rows)
 
-            # create table
-            self.logic.renderTableData(tableNode, csv_header, csv_data)
+        return ["Key", "Value"], rows
+
+    def _readCsvOutputFile(self, output_file: str) -> tuple[list[str], list]:
+        import csv
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ModuleNotFoundError:
+            pacsv = None
+
+        # read csv file
+        with open(output_file) as f:
+            reader = csv.reader(f)
+            csv_header = next(reader)
+            csv_data = None
+
+            # columnar parse when pyarrow is installed; every column is read as
+            # string so cells show verbatim, ragged files fall back to csv.reader
+            if pacsv is not None:
+                try:
+                    tbl = pacsv.read_csv(
+                        output_file,
+                        convert_options=pacsv.ConvertOptions(
+                            column_types={name: pa.string() for name in csv_header},
+                            strings_can_be_null=False,
+                        ),
+                    )
+                    csv_data = list(zip(*(c.to_pylist() for c in tbl.columns)))
+                    del tbl
+                except pa.ArrowInvalid:
+                    logger.debug("pyarrow could not parse %s, falling back to csv", output_file)
+
+            if csv_data is None:
+                csv_data = list(reader)
 
-        elif output_file.endswith(".seg.dcm"):
-            self.logic.loadSegmentations([output_file])
+        return csv_header, csv_data
 
     def _loadTabularOutputsFromRun(self, output_dir: str) -> None:
         assert self.logic is not None
-        output_files = self.logic.scanDirectoryForFilesWithExtension(output_dir, extension=[".json", ".csv"])
+        output_files = self.logic.scanDirectoryForFilesWithExtension(output_dir, extension=self._TABULAR_OUTPUT_EXTENSIONS)
         if not output_files:
             return
         json_files = [path for path in output_files if path.endswith(".json")]
@@ -1866,7 +2290,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         return output_file or None
 
     def _isSupportedOutputFile(self, output_file: str) -> bool:
-        return output_file.endswith((".json", ".csv", ".seg.dcm"))
+        return output_file.endswith(self._OUTPUT_FILE_EXTENSIONS)
 
     def _updateOpenOutputFileButton(self) -> None:
         if not hasattr(self.ui, "cmdOpenOutputFile"):
@@ -1876,8 +2300,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.ui.cmdOpenOutputFile.enabled = enabled
         icon_name = "hi_show" if enabled else "hi_noshow"
         opacity = 1.0 if enabled else self._ICON_DISABLED_OPACITY
-        self.ui.cmdOpenOutputFile.setIcon(self._themeIcon(icon_name, opacity))
-        self.ui.cmdOpenOutputFile.setIconSize(qt.QSize(14, 14))
+        self._setButtonIcon(self.ui.cmdOpenOutputFile, icon_name, opacity)
 
     def onCancelButton(self) -> None:
 
@@ -1930,6 +2353,8 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         # return
 
         # deactivate apply button and activate cancel button
+        # (buttons are set directly here, so the next _checkCanApply must not short-circuit)
+        self._lastApplyState = None
         self.ui.applyButton.enabled = False
         self.ui.cancelButton.enabled = True
         self._updateMainButtonIcons()
@@ -1942,9 +2367,7 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
         # create hash from instanceUIDs if available
         if instanceUIDs:
-            hash = hashlib.sha256()
-            hash.update(instanceUIDs.encode('utf-8'))
-            instance_idh = hash.hexdigest()
+            instance_idh = hashlib.sha256(instanceUIDs.encode('utf-8')).hexdigest()
         else:
             instance_idh = "non-dicom"
             logger.debug("No DICOM instanceUIDs for node: %s", node.GetName() if node else None)
@@ -1961,8 +2384,6 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         with slicer.util.tryWithErrorDisplay(_("Failed to compute results."), waitCursor=True):
             assert self.logic is not None
 
-            import shutil
-
             # TODO: create temp directory for slicer-mhub under $HOME/.slicer-mhub ??
             #tmp_dir = "/Users/lenny/Projects/SlicerMHubIntegration/SlicerMHubRunner/return_data"
             tmp_dir = "/tmp/mhub_slicer_extension"
@@ -1972,8 +2393,12 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             output_dir = os.path.join(runs_dir, runid)
 
             # if input dir exists, remove it -> we always make sure to run on a fresh input dir (NOTE: parallel execution ofc wouldn't work like this)
+            # an already empty input dir is reused as is
             if os.path.exists(input_dir):
-                shutil.rmtree(input_dir)
+                with os.scandir(input_dir) as it:
+                    has_entries = any(True for _ in it)
+                if has_entries:
+                    shutil.rmtree(input_dir)
 
             # create temp dir with input and output dir
             os.makedirs(input_dir, exist_ok=True)
@@ -1997,11 +2422,12 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             self.logic.copy_node(
                 self.ui.inputSelector.currentNode(),
                 input_dir,
-                modality=modality
+                modality=modality,
+                strategy="hardlink_or_copy",
             )
 
             # clear logs
-            self.ui.txtLogs.clear()
+            self._clearLogOutput()
 
             # PROGRESS handler
             def onProgress(progress: float, stdout: str | None):
@@ -2122,12 +2548,12 @@ class MHubRunnerWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 #     def onStop(self):
 #         pass
 
-class ModelStatus(Enum):
-    UNKNOWN = "unknown"         # Model status is unknown
-    PULLABLE = "pullable"       # Model can be pulled
-    PULLING = "pulling"        # Model is beeing pulled
-    PULLED = "pulled"           # Model is available locally
-    RUNNING = "running"         # Model is running
+class ModelStatus(IntEnum):
+    UNKNOWN = 0                 # Model status is unknown
+    PULLABLE = 1                # Model can be pulled
+    PULLING = 2                 # Model is beeing pulled
+    PULLED = 3                  # Model is available locally
+    RUNNING = 4                 # Model is running
 
 @dataclass
 class Model:
@@ -2148,17 +2574,14 @@ class Model:
 
     status: ModelStatus = ModelStatus.UNKNOWN
 
+    # lowercased searchable fields, separated so a match cannot span two fields
+    _search_blob: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._search_blob = "\x1f".join([self.name, self.label, self.description, *self.roi, *self.modalities, *self.categories]).lower()
+
     def str_match(self, text: str) -> bool:
-        tl = text.lower()
-        if tl in self.name.lower() or tl in self.label.lower() or tl in self.description.lower():
-            return True
-        if any([tl in r.lower() for r in self.roi]):
-            return True
-        if any([tl in m.lower() for m in self.modalities]):
-            return True
-        if any([tl in c.lower() for c in self.categories]):
-            return True
-        return False
+        return text.lower() in self._search_blob
 
 # @dataclass
 # class HostInformation:
@@ -2306,18 +2729,66 @@ class ProgressObserver:
     # _onProgress: Optional[Callable[[int, str], None]] = None
     # _onStop: Optional[Callable[[int, str, bool, bool], None]] = None
 
-    # keep track of all running tasks
-    _tasks: list['ProgressObserver'] = []
+    # keep track of all running tasks (by id, in registration order)
+    _tasks: dict[int, 'ProgressObserver'] = {}
+
+    # running tasks by (operation, image_name), the lookup hydration does for every model
+    _tasks_by_key: dict[tuple[Any, Any], list['ProgressObserver']] = {}
+
+    # number of active (not killed) tasks with operation "run"
+    running_count: int = 0
+
+    # one timer drives all tasks; each task is polled once its own period has passed
+    _shared_timer: qt.QTimer | None = None
+
+    # tasks without new output for this many polls back off to the idle period
+    _IDLE_POLLS_BEFORE_BACKOFF = 4
+    _IDLE_PERIOD_MS = 2000.0
+
+    @classmethod
+    def _startTicking(cls, task: 'ProgressObserver'):
+        if cls._shared_timer is None:
+            cls._shared_timer = qt.QTimer()
+            cls._shared_timer.timeout.connect(cls._tickAll)
+
+        # tick at the fastest requested rate
+        interval = int(task._period_ms)
+        if not cls._shared_timer.isActive():
+            cls._shared_timer.setInterval(interval)
+            cls._shared_timer.start()
+        elif interval < cls._shared_timer.interval:
+            cls._shared_timer.setInterval(interval)
+
+    @classmethod
+    def _tickAll(cls):
+        elapsed_ms = cls._shared_timer.interval
+        for task in list(cls._tasks.values()):
+            task._tick(elapsed_ms)
+
+        # follow the fastest period still in use (tasks back off while idle)
+        periods = [task._period_ms for task in cls._tasks.values() if task._ticking]
+        if not periods:
+            cls._shared_timer.stop()
+            return
+        interval = int(min(periods))
+        if interval != cls._shared_timer.interval:
+            cls._shared_timer.setInterval(interval)
 
     @classmethod
     def killAll(cls):
-        for task in list(cls._tasks):
+        for task in list(cls._tasks.values()):
             task.kill()
 
     @classmethod
     def getTasksWhere(cls, include_disabled: bool = False, **kwargs) -> list['ProgressObserver']:
+
+        # indexed lookup for the common (operation, image_name) query
+        if len(kwargs) == 2 and "operation" in kwargs and "image_name" in kwargs:
+            tasks = cls._tasks_by_key.get((kwargs["operation"], kwargs["image_name"]), ())
+            return [task for task in tasks if include_disabled or not task._disabled]
+
         matched_tasks = []
-        for task in cls._tasks:
+        for task in cls._tasks.values():
 
             if task.data is None:
                 continue
@@ -2365,38 +2836,86 @@ class ProgressObserver:
         self._onProgress: Callable[[float, str], None] | None = None
         self._onStop: Callable[[int, str, bool, bool], None] | None = None
 
-        # initialize timer
-        self._timer: qt.QTimer = qt.QTimer()
-        self._timer.setInterval(1000/frequency)
-        self._timer.timeout.connect(self._onTimeout)
-
-        # create a temp file for stdout
-        stdout_file = tempfile.NamedTemporaryFile(delete=False, prefix="mhub_slicer_stdout_", suffix=".txt")
-        stdout_file.close()
-
-        logger.debug("Temp file created: %s", stdout_file.name)
-        self._stdout_file_name = stdout_file.name
-
-        # create empty file
-        with open(stdout_file.name, 'w') as f:
-            f.write("")
-
-        logger.debug(
-            "Temp file exists: %s %s",
-            self._stdout_file_name,
-            os.path.exists(self._stdout_file_name),
+        # polling schedule on the shared timer
+        self._ticking = False
+        self._period_ms = 1000 / frequency
+        self._since_tick_ms = 0.0
+        self._idle_polls = 0
+
+        # stdout is read from a non-blocking pipe where supported, from a temp file otherwise
+        self._stdout_file_name: str | None = None
+        if fcntl is None:
+
+            # create an (empty) temp file for stdout
+            stdout_file = tempfile.NamedTemporaryFile(delete=False, prefix="mhub_slicer_stdout_", suffix=".txt")
+            stdout_file.close()
+
+            logger.debug("Temp file created: %s", stdout_file.name)
+            self._stdout_file_name = stdout_file.name
+        self._stdout_fd: int | None = None
+        # decode like a text-mode file would (universal newlines), across chunk boundaries
+        self._stdout_decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder('utf-8')(errors='replace'),
+            translate=True,
         )
-        self._stdout_readpointer = 0
+
+        # everything read so far, handed to the stop callback without reading the output twice
+        self._stdout_parts: list[str] = []
 
         # run command
         self._run(cmd)
 
         # add to tasks
-        self._tasks.append(self)
+        self._tasks[id(self)] = self
+        self._task_key = self._taskKey()
+        if self._task_key is not None:
+            self._tasks_by_key.setdefault(self._task_key, []).append(self)
+        self._counted_as_running = self.data is not None and self.data.get("operation") == "run"
+        if self._counted_as_running:
+            ProgressObserver.running_count += 1
+
+    def _releaseRunning(self):
+        if self._counted_as_running:
+            self._counted_as_running = False
+            ProgressObserver.running_count -= 1
+
+    def _taskKey(self) -> tuple[Any, Any] | None:
+        if self.data is None or "operation" not in self.data or "image_name" not in self.data:
+            return None
+        return (self.data["operation"], self.data["image_name"])
+
+    def _unregister(self):
+        # idempotent, a task may be unregistered by both its stop path and kill()
+        self._releaseRunning()
+        if self._tasks.pop(id(self), None) is None:
+            return
+        if self._task_key is not None:
+            indexed = self._tasks_by_key[self._task_key]
+            indexed.remove(self)
+            if not indexed:
+                del self._tasks_by_key[self._task_key]
 
     def _run(self, cmd: list[str]):
         import subprocess
 
+        # run command with stdout on a non-blocking pipe that is drained every tick
+        if self._stdout_file_name is None:
+            self._proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=self._env,
+                bufsize=0,
+            )
+            fd = self._proc.stdout.fileno()
+            fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+            self._stdout_fd = fd
+
+            # start polling
+            self._ticking = True
+            self._startTicking(self)
+            return
+
         # run command
         with open(self._stdout_file_name, 'w', encoding='utf-8') as stdout_file:
             self._proc = subprocess.Popen(
@@ -2408,65 +2927,115 @@ class ProgressObserver:
                 encoding='utf-8'
             )
 
-        # start timer
-        self._timer.start()
+        # keep one read handle for tailing, the kernel file offset tracks what was consumed
+        self._stdout_fd = os.open(self._stdout_file_name, os.O_RDONLY | getattr(os, "O_BINARY", 0))
 
-    def _stop(self, returncode: int, timedout: bool, killed: bool):
+        # start polling
+        self._ticking = True
+        self._startTicking(self)
 
-        # cleanup (delete stdout file)
-        logger.debug(
-            "Read and remove temp stdout file: %s %s",
-            self._stdout_file_name,
-            os.path.exists(self._stdout_file_name),
-        )
+    def _readStdout(self) -> str:
 
-        # retrieve stdout
-        with open(self._stdout_file_name, encoding='utf-8') as f:
-            stdout = f.read()
+        # drain everything written since the last read in 64k chunks
+        # (end of file, or nothing pending on the non-blocking pipe)
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self._stdout_fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+        # incremental decoding keeps multi-byte characters split across reads intact
+        stdout = self._stdout_decoder.decode(b"".join(chunks))
+        if stdout:
+            self._stdout_parts.append(stdout)
+        return stdout
+
+    def _closeStdout(self):
+        if self._stdout_fd is None:
+            return
+        if self._stdout_file_name is None:
+            # the pipe fd is owned by the Popen file object
+            self._proc.stdout.close()
+        else:
+            os.close(self._stdout_fd)
+        self._stdout_fd = None
+
+    def _stop(self, returncode: int, timedout: bool, killed: bool):
 
-        # remove file
-        os.remove(self._stdout_file_name)
+        # collect whatever is still pending and release the handle
+        # (the temp file cannot be removed while open on windows)
+        self._readStdout()
+        self._stdout_parts.append(self._stdout_decoder.decode(b"", final=True))
+        self._closeStdout()
+        stdout = "".join(self._stdout_parts)
+
+        # cleanup (delete stdout file)
+        if self._stdout_file_name is not None:
+            logger.debug("Remove temp stdout file: %s", self._stdout_file_name)
+            os.remove(self._stdout_file_name)
 
         # stop callback
         if self._onStop:
             self._onStop(returncode, stdout, timedout, killed)
 
-    def _onTimeout(self):
+    def _tick(self, elapsed_ms: float):
+        if not self._ticking:
+            return
+        self._since_tick_ms += elapsed_ms
+        if self._since_tick_ms + 1e-6 < self._period_ms:
+            return
+        since_last_poll_ms = self._since_tick_ms
+        self._since_tick_ms = 0.0
+        self._onTimeout(since_last_poll_ms)
+
+    def _onTimeout(self, elapsed_ms: float | None = None):
         assert self._proc is not None
 
         # skip if disabled
         if self._disabled:
             return
 
-        # update time
-        self._seconds_elapsed += 1.0 / self._frequency
+        # update time (the actual time since the last poll, the period varies)
+        if elapsed_ms is None:
+            elapsed_ms = self._period_ms
+        self._seconds_elapsed += elapsed_ms / 1000.0
 
         # check timeout condition
         if self._timeout > 0 and self._seconds_elapsed > self._timeout:
-            self._timer.stop()
+            self._ticking = False
             self._proc.kill()
             self._stop(-1, True, False)
-            self._tasks.remove(self)
+            self._unregister()
             return
 
         # stop timer if process is done
         if self._proc.poll() is not None:
             returncode = self._proc.returncode
-            self._timer.stop()
+            self._ticking = False
             self._stop(returncode, False, False)
-            self._tasks.remove(self)
+            self._unregister()
             return
 
-        # call progress method
-        if self._onProgress:
+        # read new output every tick: a pipe must be drained or the process blocks once it is
+        # full, and the collected output is what the stop callback receives
+        stdout = self._readStdout()
 
-            # fetch the latest process stdout from file
-            with open(self._stdout_file_name, encoding='utf-8') as f:
-                f.seek(self._stdout_readpointer)
-                stdout = f.read()
-                self._stdout_readpointer = f.tell()
+        # back off while the process is quiet (e.g. waiting on the network), poll at the
+        # requested frequency again as soon as it writes output
+        if stdout:
+            self._idle_polls = 0
+            self._period_ms = 1000 / self._frequency
+        else:
+            self._idle_polls += 1
+            if self._idle_polls > self._IDLE_POLLS_BEFORE_BACKOFF:
+                self._period_ms = max(1000 / self._frequency, self._IDLE_PERIOD_MS)
 
-            # call progress callback
+        # call progress callback
+        if self._onProgress:
             self._onProgress(self._seconds_elapsed, stdout)
 
     def onStop(self, callback: Callable[[int, str, bool, bool], None]):
@@ -2477,11 +3046,12 @@ class ProgressObserver:
 
     def kill(self):
 
-        # disable
+        # disable (disabled tasks no longer count as running)
         self._disabled = True
+        self._releaseRunning()
 
-        # stop the timer
-        self._timer.stop()
+        # stop polling
+        self._ticking = False
 
         # try to stop
         try:
@@ -2494,7 +3064,41 @@ class ProgressObserver:
             self._proc.kill()
 
         # remove from tasks
-        self._tasks.remove(self)
+        self._unregister()
+
+# the catalog repeats a handful of license texts across all models
+@functools.lru_cache(maxsize=256)
+def _license_allows_commercial_use_cached(license_text: str | None) -> bool:
+    if not license_text:
+        return False
+    text = license_text.lower()
+    if "mit" in text:
+        return True
+    if "apache" in text:
+        return True
+    if "cc" in text or "creative commons" in text:
+        return "nc" not in text
+    return False
+
+def _read_json_file(path: str, use_orjson: bool = True) -> Any:
+    # read the raw bytes in one go (no text layer); json detects their utf encoding itself.
+    # orjson parses considerably faster, but rejects NaN / Infinity (which json.dump writes
+    # by default) and turns integers beyond 64 bit into floats; such input falls back to
+    # json, callers reading arbitrary user files opt out of orjson entirely
+    import json
+    with open(path, "rb") as f:
+        raw = f.read()
+    if use_orjson:
+        try:
+            import orjson
+        except ModuleNotFoundError:
+            orjson = None
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(raw)
 
 # MHubRunnerLogic
 #
@@ -2509,6 +3113,29 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
     https://github.com/Slicer/Slicer/blob/main/Base/Python/slicer/ScriptedLoadableModule.py
     """
 
+    # seconds a `docker images` listing is reused for cached lookups
+    _LOCAL_IMAGES_CACHE_TTL = 5.0
+
+    # seconds a `docker` PATH lookup (found or not) is reused before probing again
+    _DOCKER_PATH_CACHE_TTL = 5.0
+
+    # modalities written as-is when exporting a volume to dicom, anything else becomes SC
+    _EXPORT_MODALITIES = frozenset(("CT", "MR", "NM", "US", "PT", "CR", "SC"))
+
+    # segment colors are given as 0-255 in meta.json, segments expect 0-1
+    _INV_255 = 1.0 / 255.0
+    _DEFAULT_SEGMENT_RGB = (150.0 / 255.0, 150.0 / 255.0, 0.0)
+
+    # code sequences of a segment, in the order SerializeTerminologyEntry takes them
+    # (category, type, type modifier | anatomic region, region modifier)
+    _SEGMENT_CODE_SEQUENCES = (
+        "SegmentedPropertyCategoryCodeSequence",
+        "SegmentedPropertyTypeCodeSequence",
+        "SegmentedPropertyTypeModifierCodeSequence",
+        "AnatomicRegionSequence",
+        "AnatomicRegionModifierSequence",
+    )
+
     def __init__(self) -> None:
         """
         Called when the logic class is instantiated. Can be used for initializing member variables.
@@ -2516,6 +3143,15 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         ScriptedLoadableModuleLogic.__init__(self)
         self.setupPythonRequirements()
         self._executables: dict[str, str] = {}
+        self._images_cache: tuple[float, list[str]] | None = None
+        self._pulled_image_names: tuple[list[str], frozenset[str]] | None = None
+        self._docker_path_cache: tuple[float, str | None] | None = None
+        self._env_path_cache: dict[tuple[str, str | None], str] = {}
+        self._http = None
+        self._segmentation_importer_instance = None
+        self._cleanup_executor = None
+        self._models_etag: str | None = None
+        self._models_last_modified: str | None = None
         # self.hosts: List[str] = []
         # self.hostInfo: Dict[str, HostInformation] = {}
 
@@ -2542,28 +3178,37 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
             slicer.util.pip_install('paramiko')
 
     def _build_subprocess_env(self, executable_path: str | None = None) -> dict[str, str]:
+
+        # a fresh copy of the current environment on every call (variables like DOCKER_HOST
+        # may change at runtime); only the extended PATH is cached, it depends on nothing but
+        # the executable and the current PATH (and costs a realpath to derive)
         env = os.environ.copy()
-        if executable_path:
-            path_entries = env.get("PATH", "").split(os.pathsep) if env.get("PATH") else []
+        if not executable_path:
+            return env
+
+        current_path = env.get("PATH")
+        key = (executable_path, current_path)
+        extended_path = self._env_path_cache.get(key)
+        if extended_path is None:
+            path_entries = current_path.split(os.pathsep) if current_path else []
             exec_dir = os.path.dirname(executable_path)
             real_exec_dir = os.path.dirname(os.path.realpath(executable_path))
             for path in (exec_dir, real_exec_dir):
                 if path and path not in path_entries:
                     path_entries.insert(0, path)
-            env["PATH"] = os.pathsep.join(path_entries)
+            extended_path = os.pathsep.join(path_entries)
+            self._env_path_cache[key] = extended_path
+        env["PATH"] = extended_path
         return env
 
+    def _dockerContext(self) -> tuple[str | None, dict[str, str]]:
+        # executable and environment for docker calls; the executable is memoized, the
+        # environment is rebuilt from os.environ each time (only its PATH part is cached)
+        docker_exec = self.getDockerExecutable()
+        return docker_exec, self._build_subprocess_env(docker_exec)
+
     def _license_allows_commercial_use(self, license_text: str | None) -> bool:
-        if not license_text:
-            return False
-        text = license_text.lower()
-        if "mit" in text:
-            return True
-        if "apache" in text:
-            return True
-        if "cc" in text or "creative commons" in text:
-            return "nc" not in text
-        return False
+        return _license_allows_commercial_use_cached(license_text)
 
     def _commercial_use_allowed(self, model_license: str | None, weights_license: str | None) -> bool:
         return (
@@ -2608,36 +3253,58 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
             MHUBAI_API_ENDPOINT_MODELS = "https://mhub.ai/api/v2/models/detailed"
 
             try:
-                response = requests.get(MHUBAI_API_ENDPOINT_MODELS, timeout=10)
-                response.raise_for_status()
-                payload = response.json()
-
-                # get model list
-                for model_data in payload['data']:
-
-                    # check if model inputs are compatible with slicer extension
-                    inputs_compatibility = len(model_data['inputs']) == 1 and all([i['format'].lower() == 'dicom' for i in model_data['inputs']]) and ('Segmentation' in model_data['categories'] or 'Prediction' in model_data['categories'])
-                    license_info = model_data.get('licence') or {}
-                    license_model = license_info.get('model') or ""
-                    license_weights = license_info.get('weights') or ""
-                    commercial_use = self._commercial_use_allowed(license_model, license_weights)
-
-                    # create model
-                    models.append(Model(
-                        id=model_data['id'],
-                        name=model_data['name'],
-                        label=model_data['label'],
-                        description=model_data['description'],
-                        modalities=model_data['modalities'],
-                        roi=model_data['segmentations'],
-                        categories=model_data['categories'],
-                        cite=model_data['cite'],
-                        license_model=license_model,
-                        license_weights=license_weights,
-                        commercial_use=commercial_use,
-                        inputs=[i['description'] for i in model_data['inputs']],
-                        inputs_compatibility=inputs_compatibility
-                    ))
+                # conditional request on a pooled session, an unchanged catalog answers 304 without a body
+                if self._http is None:
+                    self._http = requests.Session()
+                headers = {}
+                if hasattr(self, "_model_cache"):
+                    if self._models_etag:
+                        headers["If-None-Match"] = self._models_etag
+                    if self._models_last_modified:
+                        headers["If-Modified-Since"] = self._models_last_modified
+                response = self._http.get(MHUBAI_API_ENDPOINT_MODELS, timeout=10, headers=headers)
+
+                if response.status_code == 304 and hasattr(self, "_model_cache"):
+                    logger.debug("Model catalog not modified, keeping cached models")
+                    models = self._model_cache
+                else:
+                    response.raise_for_status()
+                    try:
+                        import orjson
+                        payload = orjson.loads(response.content)
+                    except ModuleNotFoundError:
+                        payload = response.json()
+                    self._models_etag = response.headers.get("ETag")
+                    self._models_last_modified = response.headers.get("Last-Modified")
+
+                    # get model list
+                    for model_data in payload['data']:
+
+                        # check if model inputs are compatible with slicer extension (a single dicom input)
+                        inputs = model_data['inputs']
+                        categories = model_data['categories']
+                        inputs_compatibility = len(inputs) == 1 and inputs[0]['format'].lower() == 'dicom' and ('Segmentation' in categories or 'Prediction' in categories)
+                        license_info = model_data.get('licence') or {}
+                        license_model = license_info.get('model') or ""
+                        license_weights = license_info.get('weights') or ""
+                        commercial_use = self._commercial_use_allowed(license_model, license_weights)
+
+                        # create model
+                        models.append(Model(
+                            id=model_data['id'],
+                            name=model_data['name'],
+                            label=model_data['label'],
+                            description=model_data['description'],
+                            modalities=model_data['modalities'],
+                            roi=model_data['segmentations'],
+                            categories=categories,
+                            cite=model_data['cite'],
+                            license_model=license_model,
+                            license_weights=license_weights,
+                            commercial_use=commercial_use,
+                            inputs=[i['description'] for i in inputs],
+                            inputs_compatibility=inputs_compatibility
+                        ))
 
                 # cache
                 self._model_cache = models
@@ -2655,23 +3322,29 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
     def hydrateModelStatus(
         self,
         models: list[Model] | None = None,
-        cached_images: bool = False,
+        cached_images: bool = True,
     ) -> list[Model]:
         if models is None:
             models = getattr(self, "_model_cache", [])
 
-        # get local images
-        # NOTE: refresh when docker images change
+        # get local images (repeated calls within the cache ttl get the very same list back,
+        # so the derived name set is only rebuilt when docker was actually queried again)
         images = self.getLocalImages(cached=cached_images)
-        images = [i.split()[0] for i in images]
+        if self._pulled_image_names is None or self._pulled_image_names[0] is not images:
+            self._pulled_image_names = (images, frozenset(i.split()[0] for i in images))
+        pulled = self._pulled_image_names[1]
+        has_tasks = bool(ProgressObserver._tasks_by_key)
 
         # iterate models and update state
         for model in models:
             model_image_name = f"mhubai/{model.name}:latest"
 
-            if model_image_name in images:
+            if model_image_name in pulled:
                 model.status = ModelStatus.PULLED
 
+            elif not has_tasks:
+                model.status = ModelStatus.PULLABLE
+
             elif ProgressObserver.getTasksWhere(operation="update", image_name=model_image_name):
                 model.status = ModelStatus.PULLING
 
@@ -2685,7 +3358,6 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
 
     def getDockerExecutable(self, refresh: bool = False) -> str | None:
         import platform
-        import subprocess
 
         if not refresh and "docker" in self._executables and self._executables["docker"]:
             return self._executables["docker"]
@@ -2700,33 +3372,39 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         elif ops == "Darwin":
             docker_executable = "/usr/local/bin/docker"
         elif ops == "Linux":
-            try:
-                docker_executable = subprocess.run(["which", "docker"], capture_output=True).stdout.decode('utf-8').strip('\n')
-            except Exception as e:
-                pass
+            # a missing docker is not probed again on every call (each docker action asks for it)
+            docker_executable = self.whichDocker(refresh=refresh)
 
         logger.debug("Docker executable: %s", docker_executable)
 
-        # error
-        if docker_executable is None or docker_executable == "":
-            logger.warning("Docker executable not found.")
-
         # cache
         if docker_executable:
             self._executables["docker"] = docker_executable
 
-        # deliver
-        return docker_executable
+        # deliver (None if not found)
+        return docker_executable or None
+
+    def whichDocker(self, refresh: bool = False) -> str | None:
+        # PATH lookup in-process instead of forking `which`, the result (found or not) is
+        # reused briefly; the widget's availability checks share this cache
+        now = time.monotonic()
+        cached = self._docker_path_cache
+        if not refresh and cached is not None and now - cached[0] < self._DOCKER_PATH_CACHE_TTL:
+            return cached[1]
+        docker_path = shutil.which("docker")
+        if docker_path is None:
+            logger.warning("Docker executable not found.")
+        self._docker_path_cache = (now, docker_path)
+        return docker_path
 
     def getDockerInformation(self) -> DockerInformation:
         import subprocess
 
         info = DockerInformation(version="N/A", available=False)
         try:
-            docker_exec = self.getDockerExecutable()
+            docker_exec, env = self._dockerContext()
             assert docker_exec is not None, "Docker executable not found"
             logger.debug("Running %s --version", docker_exec)
-            env = self._build_subprocess_env(docker_exec)
             result = subprocess.run([docker_exec, "--version"], timeout=5, check=True, capture_output=True, env=env)
             info.version = result.stdout.decode('utf-8')
             info.available = True
@@ -2757,15 +3435,16 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         # get images
         import subprocess
 
-        # cache
-        if cached and hasattr(self, "_images_cache"):
-            return self._images_cache
+        # cache (short-lived, dropped whenever an image is pulled or removed)
+        if cached and self._images_cache is not None:
+            cached_at, cached_images = self._images_cache
+            if time.monotonic() - cached_at < self._LOCAL_IMAGES_CACHE_TTL:
+                return cached_images
 
         # load docker images
         try:
-            docker_exec = self.getDockerExecutable()
+            docker_exec, env = self._dockerContext()
             assert docker_exec is not None, "Docker executable not found"
-            env = self._build_subprocess_env(docker_exec)
             result = subprocess.run(
                 [docker_exec, "images", "--filter", "reference=mhubai/*", "--format", "{{.Repository}}|{{.Tag}}|{{.Size}}"],
                 timeout=5,
@@ -2773,17 +3452,19 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
                 capture_output=True,
                 env=env,
             )
-            images = [i.split("|") for i in result.stdout.decode('utf-8').split("\n")]
-            images = [f"{i[0]}:latest ({i[2]})" for i in images if len(i) == 3 and i[1] == "latest"]
-
-            # remove empty strings
-            images = [image for image in images if image != ""]
+            # one pass over the `repository|tag|size` lines, keeping latest tags only
+            images = [
+                f"{parts[0]}:latest ({parts[2]})"
+                for line in result.stdout.decode('utf-8').splitlines() if line
+                for parts in (line.split("|"),)
+                if len(parts) == 3 and parts[1] == "latest"
+            ]
 
         except Exception as e:
             images = []
 
         # cache
-        self._images_cache = images
+        self._images_cache = (time.monotonic(), images)
 
         # return
         return images
@@ -2792,7 +3473,22 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         instanceUIDs = node.GetAttribute('DICOM.instanceUIDs') if node else None
         if instanceUIDs:
             instanceUIDs = instanceUIDs.split()
-            files = [slicer.dicomDatabase.fileForInstance(instanceUID) for instanceUID in instanceUIDs]
+            db = slicer.dicomDatabase
+
+            # a node usually covers its whole series: with the series uid from the subject
+            # hierarchy, two queries (instances, files) replace one lookup per instance
+            # (order is irrelevant, files are staged); partial series use the per-instance path
+            shNode = slicer.mrmlScene.GetSubjectHierarchyNode()
+            itemId = shNode.GetItemByDataNode(node) if shNode else 0
+            seriesUID = shNode.GetItemUID(itemId, 'DICOM') if itemId else ""
+            if seriesUID and len(instanceUIDs) > 1:
+                seriesInstances = db.instancesForSeries(seriesUID)
+                if len(seriesInstances) == len(instanceUIDs) and set(seriesInstances) == set(instanceUIDs):
+                    files = db.filesForSeries(seriesUID)
+                    if len(files) == len(instanceUIDs):
+                        return [f for f in files if f]
+
+            files = [db.fileForInstance(instanceUID) for instanceUID in instanceUIDs]
             return [f for f in files if f]
 
         storageNode = node.GetStorageNode() if node else None
@@ -2807,22 +3503,18 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         if not modality:
             return "SC"
         normalized = str(modality).strip().upper()
-        if normalized in ("CT", "MR", "NM", "US", "PT", "CR", "SC"):
-            return normalized
-        return "SC"
+        return normalized if normalized in self._EXPORT_MODALITIES else "SC"
 
     def _build_dicom_export_tags(self, volume_node, modality: str | None = None) -> dict[str, str]:
         now = datetime.now()
         date = now.strftime("%Y%m%d")
         time_value = now.strftime("%H%M%S")
         volume_name = volume_node.GetName() if volume_node else "SlicerVolume"
-        try:
-            import pydicom
-        except Exception as exc:
-            raise RuntimeError("pydicom is required to generate DICOM UIDs.") from exc
-        study_uid = pydicom.uid.generate_uid()
-        series_uid = pydicom.uid.generate_uid()
-        frame_uid = pydicom.uid.generate_uid()
+
+        # uuid derived uids (2.25.<int>, PS3.5 B.2) from a single random draw, the siblings
+        # are consecutive integers and at most 44 characters long (limit is 64)
+        uid_root = uuid.uuid4().int
+        study_uid, series_uid, frame_uid = (f"2.25.{uid_root + i}" for i in range(3))
 
         return {
             "Patient Name": "Slicer^User",
@@ -2862,7 +3554,9 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         if not exporter.export():
             raise RuntimeError("Creating DICOM files from the selected volume failed.")
 
-        return self.scanDirectoryForFilesWithExtension(output_dir, extension=[])
+        # the series is written flat into output_dir, no need for a recursive walk
+        with os.scandir(output_dir) as it:
+            return [entry.path for entry in it if entry.is_file()]
 
     def renderTableData(self, tableNode, header: list[str], data: list[list[str]]) -> None:
 
@@ -2955,12 +3649,13 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
     #             # let slicer breathe :D
     #             slicer.app.processEvents()
 
-    def copy_node(self, node, copy_dir: str, verbose: bool = True, modality: str | None = None):
+    def copy_node(self, node, copy_dir: str, verbose: bool = True, modality: str | None = None, strategy: str = "copy"):
         """
         Copy all dicom files from a dicom image node to the specified location.
-        """
-        import shutil
 
+        strategy: "copy" always copies the files, "hardlink_or_copy" hardlinks them when
+                  source and target are on the same filesystem and copies otherwise.
+        """
         if node is None:
             raise ValueError("No input node selected.")
 
@@ -2971,9 +3666,13 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
                 logger.debug("Number of files: %s", len(files))
             if not os.path.exists(copy_dir):
                 os.makedirs(copy_dir)
-            for file in files:
-                shutil.copy(file, copy_dir)
-                slicer.app.processEvents()
+            if not files:
+                return
+
+            # the first file decides whether hardlinking works for this target, the rest
+            # is staged concurrently as the copies are bound by i/o latency, not cpu
+            try_link = self._fast_copy(files[0], copy_dir, strategy == "hardlink_or_copy")
+            self._stageFilesConcurrently(files[1:], copy_dir, try_link)
             return
 
         if verbose:
@@ -2982,6 +3681,46 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         if verbose:
             logger.debug("Exported %s DICOM files.", len(files))
 
+    def _stageFilesConcurrently(self, files: list[str], dst_dir: str, try_link: bool, max_workers: int = 8) -> None:
+        """
+        Link or copy files into dst_dir on a small thread pool. The ui is kept responsive
+        by pumping events while waiting, instead of after every single file.
+        """
+        if not files:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self._fast_copy, file, dst_dir, try_link) for file in files}
+            while pending:
+                done, pending = wait(pending, timeout=0.05, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    if future.exception() is not None:
+                        for other in pending:
+                            other.cancel()
+                        raise future.exception()
+                slicer.app.processEvents()
+
+    def _fast_copy(self, src: str, dst_dir: str, try_link: bool = False) -> bool:
+        """
+        Place src in dst_dir as a hardlink (if try_link) or as a copy of its content.
+        Returns whether hardlinking should be attempted for the next file.
+        """
+        dst = os.path.join(dst_dir, os.path.basename(src))
+        if try_link:
+            try:
+                os.link(src, dst)
+                return True
+            except OSError as e:
+                # cross-device (or unsupported), copy this and all remaining files
+                logger.debug("Hardlinking input failed, copying instead: %s", e)
+
+        # copyfile copies in-kernel (sendfile on linux, fcopyfile on macos) and, unlike
+        # shutil.copy, skips the extra stat + chmod for the permission bits
+        shutil.copyfile(src, dst)
+        return False
+
     def _run_mhub_docker(self, model: 'Model', gpus: list[int] | None, input_dir: str, output_dir: str, onProgress: Callable[[float, str], None], onStop: Callable[[int, str, bool, bool], None], timeout: int = 600):
 
         # gpus command
@@ -2993,8 +3732,7 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
             mhub_run_gpus = ["--gpus", f"device={','.join(str(i) for i in gpus)}"]
 
         # get executable
-        docker_exec = self.getDockerExecutable()
-        env = self._build_subprocess_env(docker_exec)
+        docker_exec, env = self._dockerContext()
 
         # run mhub
         run_cmd = [
@@ -3064,8 +3802,7 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
     ):
 
         # get docker executable
-        docker_exec = self.getDockerExecutable()
-        env = self._build_subprocess_env(docker_exec)
+        docker_exec, env = self._dockerContext()
 
         # remove image cli command
         cmd = [docker_exec, "rmi", image_name]
@@ -3078,17 +3815,55 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
             data={"image_name": image_name, "operation": "remove"},
             env=env,
         )
-        if on_stop: po.onStop(on_stop)
+        self._observeImageOperation(po, "Remove image", on_stop, on_progress)
+
+    def _observeImageOperation(
+        self,
+        po: 'ProgressObserver',
+        label: str,
+        on_stop: Callable[[int, str, bool, bool], None] | None,
+        on_progress: Callable[[float, str], None] | None,
+    ) -> None:
+
+        # progress only carries the output read since the last tick; a line cut off at the
+        # end of a read is held back until it is complete (or the process stops)
+        tail = [""]
 
         def onProgress(t: float, stdout: str):
             if on_progress:
                 on_progress(t, stdout)
-            for line in stdout.split("\n"):
+            if not stdout:
+                return
+            lines = (tail[0] + stdout).split("\n")
+            tail[0] = lines.pop()
+            for line in lines:
                 if line:
-                    logger.info("Remove image: %s", line)
+                    logger.info("%s: %s", label, line)
+
+        invalidating_on_stop = self._invalidatingOnStop(on_stop)
+
+        def onStop(returncode: int, stdout: str, timedout: bool, killed: bool):
+            if tail[0]:
+                logger.info("%s: %s", label, tail[0])
+                tail[0] = ""
+            invalidating_on_stop(returncode, stdout, timedout, killed)
 
+        po.onStop(onStop)
         po.onProgress(onProgress)
 
+    def _invalidatingOnStop(
+        self,
+        on_stop: Callable[[int, str, bool, bool], None] | None,
+    ) -> Callable[[int, str, bool, bool], None]:
+
+        # local images changed, drop the cached listing before handing over to the caller
+        def _on_stop(returncode: int, stdout: str, timedout: bool, killed: bool):
+            self._images_cache = None
+            if on_stop:
+                on_stop(returncode, stdout, timedout, killed)
+
+        return _on_stop
+
     def update_image(
         self,
         image_name,
@@ -3098,8 +3873,7 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
     ):
 
         # get docker executable
-        docker_exec = self.getDockerExecutable()
-        env = self._build_subprocess_env(docker_exec)
+        docker_exec, env = self._dockerContext()
 
         # remove image cli command
         cmd = [docker_exec, "pull", image_name]
@@ -3115,29 +3889,75 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
             data={"image_name": image_name, "operation": "update"},
             env=env,
         )
-        if on_stop: po.onStop(on_stop)
+        self._observeImageOperation(po, "Pull image", on_stop, on_progress)
 
-        def onProgress(t: float, stdout: str):
-            if on_progress:
-                on_progress(t, stdout)
-            for line in stdout.split("\n"):
-                if line:
-                    logger.info("Pull image: %s", line)
-
-        po.onProgress(onProgress)
 
-
-    def scanDirectoryForFilesWithExtension(self, local_dir: str, extension: str | list[str] = ".seg.dcm") -> list[str]:
+    def scanDirectoryForFilesWithExtension(self, local_dir: str, extension: str | list[str] | tuple[str, ...] = ".seg.dcm") -> list[str]:
         """
         Find all files with the specified extension in the specified directory and its subdirectories.
         """
-        extension = extension if isinstance(extension, list) else [extension]
-        seg_files = []
-        for root, _, files in os.walk(local_dir):
-            for file in files:
-                if len(extension) == 0 or any(file.endswith(e) for e in extension):
-                    seg_files.append(os.path.join(root, file))
-        return seg_files
+        # str.endswith takes a tuple of suffixes and checks them all in one call
+        suffixes = (extension,) if isinstance(extension, str) else tuple(extension)
+        return [path for _, paths in self._walkFiles(local_dir, suffixes) for path in paths]
+
+    def _walkFiles(self, top: str, suffixes: tuple[str, ...] = (), max_workers: int = 8) -> list[tuple[str, list[str]]]:
+        """
+        List (directory, file paths) pairs below top in the same order as os.walk, keeping
+        only files whose name ends with one of suffixes (all files if empty).
+        Directories are listed concurrently, as scanning is bound by filesystem latency
+        rather than cpu (noticeable on network mounts).
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        def list_dir(path: str) -> tuple[list[str], list[str]]:
+            file_entries, subdirs = [], []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            file_entries.append(entry)
+                        elif not entry.is_symlink():
+                            # like os.walk, symlinked directories are not followed
+                            subdirs.append(entry.path)
+            except OSError:
+                pass
+
+            # match on the name, the path comes with the entry (no join); without suffixes
+            # every file is kept and no per-file test is made
+            if not suffixes:
+                return [entry.path for entry in file_entries], subdirs
+            return [entry.path for entry in file_entries if entry.name.endswith(suffixes)], subdirs
+
+        # a flat directory (the common case) is listed inline, without starting any threads
+        listing: dict[str, tuple[list[str], list[str]]] = {top: list_dir(top)}
+        if listing[top][1]:
+
+            # work queue: every subdirectory is submitted as soon as its parent is listed,
+            # so one slow directory does not hold back the rest of the tree. the workers
+            # only wait on i/o, hence the pool is not limited to the number of cpus
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = {executor.submit(list_dir, d): d for d in listing[top][1]}
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path = pending.pop(future)
+                        listing[path] = future.result()
+                        for d in listing[path][1]:
+                            pending[executor.submit(list_dir, d)] = d
+
+        # assemble in top-down os.walk order
+        walk = []
+        stack = [top]
+        while stack:
+            path = stack.pop()
+            files, subdirs = listing[path]
+            walk.append((path, files))
+            stack.extend(reversed(subdirs))
+        return walk
 
     def addFilesToDatabase(self, files: list[str], operation: Literal["reference", "copy", "move"]) -> None:
         # DICOM indexer uses the current DICOM database folder as the basis for relative paths,
@@ -3152,36 +3972,54 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         # add files to database if operation is not 'reference'
         copyFile = operation in ["copy", "move"]
 
-        # import files
-        for file in files:
-            indexer.addFile(slicer.dicomDatabase, os.path.abspath(file), copyFile)
-            slicer.app.processEvents()
+        # import files (absolute paths resolved once, events are pumped every 32 files)
+        abs_files = [os.path.abspath(file) for file in files]
+        for i, file in enumerate(abs_files):
+            indexer.addFile(slicer.dicomDatabase, file, copyFile)
+            if (i & 31) == 31:
+                slicer.app.processEvents()
+        slicer.app.processEvents()
 
         # wait for the indexing to finish
         indexer.waitForImportFinished()
 
-        # delete file if operation is 'move'
+        # delete file if operation is 'move' (concurrently, unlink is latency bound on
+        # network storage; files already gone are fine)
         if operation == "move":
-            for file in files:
-                os.remove(file)
+            from concurrent.futures import ThreadPoolExecutor
+
+            def remove(file: str) -> None:
+                try:
+                    os.remove(file)
+                except FileNotFoundError:
+                    pass
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                list(executor.map(remove, abs_files))
 
     def loadSegmentations(self, files: list[str]):
         loaded_any, loaded_paths = self._load_segmentation_from_database(files)
-        for file in files:
-            if os.path.abspath(file) in loaded_paths:
-                continue
-            logger.debug("Loading segmentation without database: %s", file)
-            if self._load_segmentation_manually(file):
-                loaded_any = True
+        if len(loaded_paths) == len(files):
+            remaining = []
+        else:
+            remaining = [file for file in files if os.path.abspath(file) not in loaded_paths]
+        if remaining and self._load_segmentations_manually(remaining):
+            loaded_any = True
 
         if not loaded_any:
             logger.warning("No segmentations loaded for files: %s", files)
 
+    def _segmentation_importer(self):
+        # the plugin keeps no per-load state, one instance serves all segmentation loads
+        if self._segmentation_importer_instance is None:
+            import DICOMSegmentationPlugin
+            self._segmentation_importer_instance = DICOMSegmentationPlugin.DICOMSegmentationPluginClass()
+        return self._segmentation_importer_instance
+
     def _load_segmentation_from_database(self, files: list[str]) -> tuple[bool, set[str]]:
-        import DICOMSegmentationPlugin
 
-        # create importer
-        importer = DICOMSegmentationPlugin.DICOMSegmentationPluginClass()
+        # get importer
+        importer = self._segmentation_importer()
 
         # examine files
         loadables = importer.examineFiles(files)
@@ -3191,42 +4029,110 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
         # import files
         loaded_any = False
         loaded_paths: set[str] = set()
+        load, abspath = importer.load, os.path.abspath
         for loadable in loadables:
-            if importer.load(loadable):
+            if load(loadable):
                 loaded_any = True
                 if loadable.files:
-                    loaded_paths.add(os.path.abspath(loadable.files[0]))
+                    loaded_paths.add(abspath(loadable.files[0]))
         if loaded_paths:
             logger.debug("Loaded segmentations from database: %s", sorted(loaded_paths))
         return loaded_any, loaded_paths
 
-    def _load_segmentation_manually(self, seg_file: str) -> bool:
-        import DICOMSegmentationPlugin
-        import glob
-        import json
-        import shutil
-        import types
+    def _load_segmentations_manually(self, files: list[str]) -> bool:
+
+        # constant across files, resolved once for the whole batch
+        importer = self._segmentation_importer()
+        terminologiesLogic = slicer.modules.terminologies.logic()
 
+        # the SEG conversions run as concurrent CLI processes, a few at a time; each result
+        # is imported on the main thread (mrml) as soon as its conversion has finished
+        max_inflight = max(1, (os.cpu_count() or 2) // 2)
+        pending = iter(files)
+        inflight: list[tuple[str, Any, str]] = []
+        loaded_any = False
+        try:
+            while True:
+                while len(inflight) < max_inflight:
+                    file = next(pending, None)
+                    if file is None:
+                        break
+                    logger.debug("Loading segmentation without database: %s", file)
+                    job = self._start_segmentation_conversion(file)
+                    if job is not None:
+                        inflight.append(job)
+                if not inflight:
+                    break
+
+                # a job leaves the list before it is finished, finishing removes its temp dir
+                for job in [done for done in inflight if not done[1].IsBusy()]:
+                    inflight.remove(job)
+                    if self._finish_segmentation_load(job, importer, terminologiesLogic):
+                        loaded_any = True
+
+                # cli node status is updated through the event loop
+                if inflight:
+                    slicer.app.processEvents()
+                    time.sleep(0.02)
+        finally:
+            # on error, stop the conversions still running and drop their output
+            if inflight:
+                self._cancel_segmentation_conversions(inflight)
+
+        return loaded_any
+
+    def _cancel_segmentation_conversions(self, jobs: list[tuple[str, Any, str]], timeout: float = 10.0) -> None:
+        for _, cliNode, _ in jobs:
+            if cliNode.IsBusy():
+                cliNode.Cancel()
+
+        # wait (bounded) for the processes to stop writing before their temp dirs are removed
+        deadline = time.monotonic() + timeout
+        while any(cliNode.IsBusy() for _, cliNode, _ in jobs) and time.monotonic() < deadline:
+            slicer.app.processEvents()
+            time.sleep(0.02)
+
+        for seg_file, _, temp_dir in jobs:
+            logger.debug("Discarding conversion of %s", seg_file)
+            self._remove_dir_in_background(temp_dir)
+
+    def _start_segmentation_conversion(self, seg_file: str) -> tuple[str, Any, str] | None:
+        """
+        Launch the conversion of a DICOM SEG into label maps (segimage2itkimage CLI).
+        Returns (seg_file, cli node, temp dir) or None if the conversion could not be started.
+        """
         if not os.path.exists(seg_file):
             logger.error("Segmentation file not found: %s", seg_file)
-            return False
+            return None
 
         try:
             segimage2itkimage = slicer.modules.segimage2itkimage
         except AttributeError:
             logger.error("segimage2itkimage CLI module is not available; cannot load %s", seg_file)
-            return False
+            return None
 
-        importer = DICOMSegmentationPlugin.DICOMSegmentationPluginClass()
+        # a unique dir per conversion (tempDirectory() is only unique per millisecond)
+        temp_dir = tempfile.mkdtemp(prefix="mhub_seg_", dir=slicer.app.temporaryPath)
+        parameters = {
+            "inputSEGFileName": seg_file,
+            "outputDirName": temp_dir,
+            "mergeSegments": True,
+        }
+        try:
+            cliNode = slicer.cli.run(segimage2itkimage, None, parameters, wait_for_completion=False)
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        return seg_file, cliNode, temp_dir
+
+    def _finish_segmentation_load(self, job: tuple[str, Any, str], importer=None, terminologiesLogic=None) -> bool:
+        import types
+
+        seg_file, cliNode, temp_dir = job
+        if importer is None:
+            importer = self._segmentation_importer()
 
-        temp_dir = slicer.util.tempDirectory()
         try:
-            parameters = {
-                "inputSEGFileName": seg_file,
-                "outputDirName": temp_dir,
-                "mergeSegments": True,
-            }
-            cliNode = slicer.cli.run(segimage2itkimage, None, parameters, wait_for_completion=True)
             if cliNode.GetStatusString() != "Completed":
                 logger.error("SEG2NRRD did not complete successfully for %s", seg_file)
                 return False
@@ -3236,15 +4142,19 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
                 logger.error("Missing meta.json for DICOM SEG: %s", seg_file)
                 return False
 
-            with open(metaFileName) as metaFile:
-                data = json.load(metaFile)
+            data = _read_json_file(metaFileName)
 
-            numberOfSegmentations = len(glob.glob(os.path.join(temp_dir, "*.nrrd")))
+            # count like glob("*.nrrd") would (hidden files excluded), without building a list
+            with os.scandir(temp_dir) as it:
+                numberOfSegmentations = sum(
+                    1 for entry in it if entry.name.endswith(".nrrd") and not entry.name.startswith(".")
+                )
             if numberOfSegmentations != len(data.get("segmentAttributes", [])):
                 logger.error("Loading failed for %s: inconsistent segment count", seg_file)
                 return False
 
-            terminologiesLogic = slicer.modules.terminologies.logic()
+            if terminologiesLogic is None:
+                terminologiesLogic = slicer.modules.terminologies.logic()
             display_name = os.path.splitext(os.path.basename(seg_file))[0]
 
             categoryContextName = display_name
@@ -3263,6 +4173,8 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
                 anatomicContextName = "Anatomic codes - DICOM master list"
 
             segmentLabelNodes = []
+            getCodeValues = importer.getValuesFromCodeSequence
+            codeSequences = self._SEGMENT_CODE_SEQUENCES
             for segmentationId, segmentAttributes in enumerate(data.get("segmentAttributes", [])):
                 labelFileName = os.path.join(temp_dir, f"{segmentationId + 1}.nrrd")
                 labelNode = slicer.util.loadLabelVolume(labelFileName, {"singleFile": True})
@@ -3274,29 +4186,18 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
                 for segment in segmentAttributes:
                     rgb255 = segment.get("recommendedDisplayRGBValue")
                     if rgb255:
-                        rgb = [float(c) / 255.0 for c in rgb255]
+                        inv255 = self._INV_255
+                        rgb = (rgb255[0] * inv255, rgb255[1] * inv255, rgb255[2] * inv255)
                     else:
-                        rgb = (150.0, 150.0, 0.0)
-
-                    categoryCode, categoryCodingScheme, categoryCodeMeaning = \
-                        importer.getValuesFromCodeSequence(segment, "SegmentedPropertyCategoryCodeSequence")
-                    typeCode, typeCodingScheme, typeCodeMeaning = \
-                        importer.getValuesFromCodeSequence(segment, "SegmentedPropertyTypeCodeSequence")
-                    typeModCode, typeModCodingScheme, typeModCodeMeaning = \
-                        importer.getValuesFromCodeSequence(segment, "SegmentedPropertyTypeModifierCodeSequence")
-                    regionCode, regionCodingScheme, regionCodeMeaning = \
-                        importer.getValuesFromCodeSequence(segment, "AnatomicRegionSequence")
-                    regionModCode, regionModCodingScheme, regionModCodeMeaning = \
-                        importer.getValuesFromCodeSequence(segment, "AnatomicRegionModifierSequence")
+                        rgb = self._DEFAULT_SEGMENT_RGB
+
+                    # (code, coding scheme, meaning) of all five sequences as one flat tuple
+                    codes = tuple(value for name in codeSequences for value in getCodeValues(segment, name))
+                    typeCodeMeaning = codes[5]
 
                     segmentTerminologyTag = terminologiesLogic.SerializeTerminologyEntry(
-                        categoryContextName,
-                        categoryCode, categoryCodingScheme, categoryCodeMeaning,
-                        typeCode, typeCodingScheme, typeCodeMeaning,
-                        typeModCode, typeModCodingScheme, typeModCodeMeaning,
-                        anatomicContextName,
-                        regionCode, regionCodingScheme, regionCodeMeaning,
-                        regionModCode, regionModCodingScheme, regionModCodeMeaning,
+                        categoryContextName, *codes[:9],
+                        anatomicContextName, *codes[9:],
                     )
 
                     if segment.get("SegmentLabel"):
@@ -3309,18 +4210,18 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
                         segmentName = typeCodeMeaning
                         segmentNameAutoGenerated = True
 
-                    labelAttributes = {}
-                    labelAttributes["Name"] = segmentName
-                    labelAttributes["NameAutoGenerated"] = segmentNameAutoGenerated
-                    labelAttributes["Description"] = segment.get("SegmentDescription")
-                    labelAttributes["Terminology"] = segmentTerminologyTag
-                    labelAttributes["ColorR"] = rgb[0]
-                    labelAttributes["ColorG"] = rgb[1]
-                    labelAttributes["ColorB"] = rgb[2]
-                    labelAttributes["DICOM.SegmentAlgorithmType"] = segment.get("SegmentAlgorithmType")
-                    labelAttributes["DICOM.SegmentAlgorithmName"] = segment.get("SegmentAlgorithmName")
-
-                    labelNode.labelAttributes.append(labelAttributes)
+                    # the plugin's _importSegmentAndRemoveLabel reads these by key, so they stay dicts
+                    labelNode.labelAttributes.append({
+                        "Name": segmentName,
+                        "NameAutoGenerated": segmentNameAutoGenerated,
+                        "Description": segment.get("SegmentDescription"),
+                        "Terminology": segmentTerminologyTag,
+                        "ColorR": rgb[0],
+                        "ColorG": rgb[1],
+                        "ColorB": rgb[2],
+                        "DICOM.SegmentAlgorithmType": segment.get("SegmentAlgorithmType"),
+                        "DICOM.SegmentAlgorithmName": segment.get("SegmentAlgorithmName"),
+                    })
 
                 segmentLabelNodes.append(labelNode)
 
@@ -3332,7 +4233,15 @@ class MHubRunnerLogic(ScriptedLoadableModuleLogic):
 
             return True
         finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            self._remove_dir_in_background(temp_dir)
+
+    def _remove_dir_in_background(self, path: str) -> None:
+        # deleting the converter output does not need to hold up the next load; the pool's
+        # workers are joined at interpreter exit, so a pending removal still completes
+        if self._cleanup_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._cleanup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mhub_cleanup")
+        self._cleanup_executor.submit(shutil.rmtree, path, ignore_errors=True)
 
 
     def openSegmentation(self, files: list[str]):